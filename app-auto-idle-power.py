@@ -1,76 +1,59 @@
+import os
 import sys
+import time
 
-from PyQt6.QtWidgets import (
-    QApplication, QSystemTrayIcon, QMenu,
-)
-from PyQt6.QtGui import QIcon, QAction
-from PyQt6.QtCore import QTimer
-
-from config.config_service import load_settings
-from gui.base_app import APP_ICON, MainWindowAppGUI
-from gui.helpers import (
-    icon_for_mode, get_idle_seconds, set_profile,
-    get_current_profile,get_status_message,
-    get_keyboard_color_by_cpu_temp, read_cpu_temperature
-)
-from gui.tabs import ui_setup_tray_menu
-
-settings = load_settings()
-
-# ---- Shared state ----
-is_idle_state = False
-
-# ---- App ----
-app = QApplication(sys.argv)
-app.setQuitOnLastWindowClosed(False)
-if APP_ICON:
-    app.setWindowIcon(QIcon(APP_ICON))
+STARTED = time.perf_counter()
 
-window_settings = MainWindowAppGUI()
-window_settings.update_current_mode(settings.active_mode)
+if "--profile-imports" in sys.argv:
+    from core.startup_profile import profile_imports
 
-tray = QSystemTrayIcon(QIcon(APP_ICON) if APP_ICON else icon_for_mode(settings.active_mode))
-tray.setToolTip("Auto Idle Power Switcher")
-ui_setup_tray_menu(window_settings, tray, app)
-tray.show()
+    sys.exit(profile_imports(os.path.abspath(__file__)))
 
+if sys.argv[1:2] == ["ctl"]:
+    from core.control import cli
 
-# ---- Background timer ----
-def tick():
-    global last_idle_seconds
-    global is_idle_state
+    sys.exit(cli(sys.argv[2:]))
 
-    idle = get_idle_seconds()
-    last_idle_seconds = idle
-    limit = settings.idle_minutes * 60
+if "--daemon" in sys.argv:
+    # headless, never imports Qt
+    from core.daemon import main as daemon_main
 
-    if idle >= limit and not is_idle_state:
-        set_profile(settings.idle_mode, idle)
-        is_idle_state = True
+    sys.exit(daemon_main())
 
-    elif idle < limit and is_idle_state:
-        set_profile(settings.active_mode, idle)
-        is_idle_state = False
+# only what the tray needs is imported here; the settings window and the
+# pydantic validation are loaded after the tray icon is up
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QIcon
 
-    # keep UI in sync with real system state
-    window_settings.refresh_current_mode_from_system()
+from config.config import settings
+from config.config_service import reload_settings
+from core.event_log import event_log, setup_sink
+from core.startup_profile import EXIT_AFTER_STARTUP_ENV
+from gui.helpers import icon_path_for_mode, rebuild_temperature_lut
+from gui.tray_app import TrayApp
 
-    current = get_current_profile()
-    if current:
-        tray.setIcon(icon_for_mode(current))
-        tray.setToolTip(get_status_message())
+reload_settings(validate=False)
+rebuild_temperature_lut()
+setup_sink(event_log)
 
-    window_settings.update_current_mode(get_current_profile())
+# ---- App ----
+app = QApplication(sys.argv)
+app.setQuitOnLastWindowClosed(False)
+app_icon = icon_path_for_mode(settings.active_mode)
+if app_icon:
+    app.setWindowIcon(QIcon(app_icon))
 
-    print(f""
-          f"idle={idle}s "
-          f"limit={limit}s is_idle_state={is_idle_state} "
-          f"CPU(t)={read_cpu_temperature()} color={get_keyboard_color_by_cpu_temp()}")
+tray_app = TrayApp(app)
+tray_app.start()
 
+tray_ready_ms = (time.perf_counter() - STARTED) * 1000
+event_log.info("startup", "Tray ready in %.0f ms", tray_ready_ms)
 
+if os.environ.get(EXIT_AFTER_STARTUP_ENV):
+    print(f"tray_ready_ms={tray_ready_ms:.1f}", flush=True)
+    sys.exit(0)
 
-timer = QTimer()
-timer.timeout.connect(tick)
-timer.start(5000)  # every 5 seconds
+QTimer.singleShot(0, tray_app.finish_startup)
 
 sys.exit(app.exec())
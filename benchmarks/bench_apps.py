@@ -0,0 +1,153 @@
+"""
+ProcessScanner cost per tick on a synthetic procfs with 1000 processes,
+against identifying every process on every tick, plus the rule
+decisions on a scripted session.
+
+    python benchmarks/bench_apps.py [--processes N] [--rounds N] [--churn N]
+
+Each timed round first starts and kills `churn` processes (untimed),
+then scans. The fake procfs goes to /dev/shm when there is one: /proc
+is memory-backed, and listing a directory on a disk filesystem costs
+about twice as much. Passes when the incremental scan stays under BUDGET_US per
+tick and the scripted session picks the expected profiles.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.procscan import ProcessScanner  # noqa: E402
+from fakes import add_process, make_fake_system, remove_process, set_comm  # noqa: E402
+
+BUDGET_US = 1000
+
+RULES = [
+    {"apps": ["cargo", "gcc", "cc1", "blender", "*.exe"], "profile": "performance"},
+    {"apps": ["firefox"], "profile": "power-saver"},
+]
+
+# a desktop session: kernel threads, services and user apps
+NAMES = ["systemd", "dbus-daemon", "pipewire", "gnome-shell", "bash", "code", "python3", "Xwayland"]
+
+
+def populate(root, count):
+    for pid in range(1, count + 1):
+        if pid % 5 == 0:
+            add_process(root, pid, f"kworker/{pid}:0", exe=False)
+        else:
+            add_process(root, pid, NAMES[pid % len(NAMES)])
+
+
+def full_scan(procfs):
+    scanner = ProcessScanner(procfs)
+    scanner.configure(RULES)
+    return scanner.scan()
+
+
+def timed_scans(root, scanner, rounds, churn, first_pid):
+    pid = first_pid
+    total = 0
+    worst = 0
+    for _ in range(rounds):
+        for i in range(churn):
+            add_process(root, pid + i, "rustc")
+        for i in range(churn):
+            if pid - churn + i >= first_pid:
+                remove_process(root, pid - churn + i)
+        pid += churn
+
+        start = time.perf_counter_ns()
+        scanner.scan()
+        elapsed = time.perf_counter_ns() - start
+        total += elapsed
+        worst = max(worst, elapsed)
+    return total / rounds / 1000, worst / 1000
+
+
+def session(root, procfs):
+    """(description, expected profile, actual profile) per step."""
+    scanner = ProcessScanner(procfs)
+    scanner.configure(RULES)
+    steps = []
+
+    def check(what, expected):
+        steps.append((what, expected, scanner.scan()))
+
+    check("desktop only", None)
+    add_process(root, 90001, "firefox")
+    check("browser", "power-saver")
+    add_process(root, 90002, "cargo")
+    check("browser + cargo", "performance")
+    remove_process(root, 90002)
+    check("cargo finished", "power-saver")
+
+    # a shell child seen before it has exec'd
+    add_process(root, 90003, "bash")
+    check("forked shell", "power-saver")
+    set_comm(root, 90003, "blender")
+    check("exec'd blender", "performance")
+    remove_process(root, 90003)
+
+    add_process(root, 90004, "GameLauncherWin", exe="/games/GameLauncherWindows.exe")
+    check("proton game (exe pattern)", "performance")
+    remove_process(root, 90004)
+    remove_process(root, 90001)
+    check("all closed", None)
+    return steps
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--processes", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=500)
+    parser.add_argument("--churn", type=int, default=5)
+    args = parser.parse_args()
+
+    shm = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    root = tempfile.mkdtemp(prefix="auto-idle-bench-", dir=shm)
+    try:
+        return run(root, args)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def run(root, args):
+    procfs = make_fake_system(root)["AUTO_IDLE_PROCFS_ROOT"]
+    populate(root, args.processes)
+
+    scanner = ProcessScanner(procfs)
+    scanner.configure(RULES)
+    start = time.perf_counter_ns()
+    scanner.scan()
+    cold = (time.perf_counter_ns() - start) / 1000
+    steady, _ = timed_scans(root, scanner, args.rounds, 0, 0)
+    churned, worst = timed_scans(root, scanner, args.rounds, args.churn, 100000)
+
+    start = time.perf_counter_ns()
+    for _ in range(20):
+        full_scan(procfs)
+    full = (time.perf_counter_ns() - start) / 20 / 1000
+
+    print(f"{len(scanner.processes)} processes, {args.churn} started/exited per churn tick")
+    print(f"{'scan':<34} {'us/tick':>9}")
+    print(f"{'first scan (identify all)':<34} {cold:>9.0f}")
+    print(f"{'incremental, no churn':<34} {steady:>9.0f}")
+    print(f"{'incremental, churn':<34} {churned:>9.0f}  (worst {worst:.0f})")
+    print(f"{'identify every process':<34} {full:>9.0f}")
+    print()
+
+    steps = session(root, procfs)
+    for what, expected, actual in steps:
+        print(f"{what:<28} {actual or '-':<12} {'ok' if actual == expected else f'expected {expected}'}")
+
+    ok = churned < BUDGET_US and all(expected == actual for _, expected, actual in steps)
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
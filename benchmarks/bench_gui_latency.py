@@ -0,0 +1,85 @@
+"""
+Measure GUI event latency while a system backend stalls.
+
+    python benchmarks/bench_gui_latency.py [delay_seconds] [run_seconds]
+
+The idle time probe is replaced with one that sleeps for delay_seconds
+(default 2) and ticks are requested every 100 ms through SystemWorker.
+A 5 ms timer on the GUI thread records how late it fires; the worst
+case must stay under one frame (16 ms).
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QApplication
+
+import core.system as system
+import gui.helpers as helpers
+from core.worker import SystemWorker
+
+FRAME_BUDGET_MS = 16.0
+PROBE_INTERVAL_MS = 5
+
+
+def main():
+    delay = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    run_for = float(sys.argv[2]) if len(sys.argv) > 2 else 6.0
+
+    app = QApplication(sys.argv)
+
+    def slow_idle_seconds():
+        time.sleep(delay)
+        return 0
+
+    system.get_idle_seconds = slow_idle_seconds
+    helpers.get_idle_monitor()
+    helpers.get_power_profiles()
+
+    worker = SystemWorker(helpers.collect_snapshot)
+    snapshots = []
+    worker.snapshot_ready.connect(snapshots.append)
+
+    tick_timer = QTimer()
+    tick_timer.timeout.connect(worker.request_snapshot)
+    tick_timer.start(100)
+
+    lateness = []
+    # the first callback only starts the clock, before it the event loop
+    # and the offscreen platform were still starting up
+    last = None
+
+    def probe():
+        nonlocal last
+        now = time.perf_counter()
+        if last is not None:
+            lateness.append((now - last) * 1000 - PROBE_INTERVAL_MS)
+        last = now
+
+    probe_timer = QTimer()
+    probe_timer.setTimerType(Qt.TimerType.PreciseTimer)
+    probe_timer.timeout.connect(probe)
+    probe_timer.start(PROBE_INTERVAL_MS)
+
+    QTimer.singleShot(int(run_for * 1000), app.quit)
+    app.exec()
+    worker.wait()
+
+    lateness.sort()
+    worst = lateness[-1]
+    p99 = lateness[int(len(lateness) * 0.99)]
+    print(f"backend delay   {delay:.1f} s")
+    print(f"snapshots       {len(snapshots)}")
+    print(f"skipped ticks   {worker.skipped_ticks}")
+    print(f"event latency   p99={p99:.2f} ms max={worst:.2f} ms")
+    ok = worst < FRAME_BUDGET_MS
+    print("PASS" if ok else f"FAIL (budget {FRAME_BUDGET_MS} ms)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""
+Compare per-call latency of the idle time backends.
+
+    python benchmarks/bench_idle.py [calls]
+
+Needs a running GNOME session (Mutter IdleMonitor on the session bus).
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QCoreApplication
+
+from gui.helpers import get_idle_monitor, get_idle_seconds_gdbus
+
+
+def measure(label, fn, calls):
+    fn()  # warm up
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    for _ in range(calls):
+        fn()
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    print(
+        f"{label:<10} {wall / calls * 1e6:10.1f} us/call wall "
+        f"{cpu / calls * 1e6:10.1f} us/call cpu"
+    )
+    return wall / calls
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    app = QCoreApplication(sys.argv)
+
+    monitor = get_idle_monitor()
+    if not monitor.is_available():
+        print("Session bus not available")
+        return 1
+
+    dbus = measure("dbus", monitor.get_idle_ms, calls)
+    gdbus = measure("gdbus", get_idle_seconds_gdbus, calls)
+    print(f"speedup    {gdbus / dbus:10.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
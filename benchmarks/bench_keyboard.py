@@ -0,0 +1,58 @@
+"""
+Compare keyboard write latency of asusd over D-Bus and asusctl.
+
+    python benchmarks/bench_keyboard.py [writes]
+
+Needs an ASUS laptop with asusd running. The keyboard is set to the
+same color repeatedly, then left as configured for power-saver.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QCoreApplication
+
+from config.config import settings
+from gui.helpers import get_asusd_keyboard, run_command
+
+COLOR = "#00ff00"
+BRIGHTNESS = "low"
+
+
+def write_asusctl(color, brightness):
+    run_command(["asusctl", "aura", "static", "-c", color.replace("#", "")])
+    run_command(["asusctl", "-k", brightness])
+
+
+def measure(label, fn, writes):
+    fn(COLOR, BRIGHTNESS)  # warm up
+    start = time.perf_counter()
+    for _ in range(writes):
+        fn(COLOR, BRIGHTNESS)
+    per_write = (time.perf_counter() - start) / writes
+    print(f"{label:<8} {per_write * 1e3:8.2f} ms/write")
+    return per_write
+
+
+def main():
+    writes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    app = QCoreApplication(sys.argv)
+
+    backend = get_asusd_keyboard()
+    if not backend.is_available():
+        print("asusd Aura interface not found on the system bus")
+        return 1
+
+    dbus = measure("asusd", backend.set_color, writes)
+    asusctl = measure("asusctl", write_asusctl, writes)
+    print(f"speedup  {asusctl / dbus:8.1f}x")
+
+    mode = settings.keyboard["modes"]["power-saver"]
+    backend.set_color(mode["color"], mode["brightness"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
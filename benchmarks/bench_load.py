@@ -0,0 +1,133 @@
+"""
+The load stage: what one CpuLoadSampler.sample() costs, and how
+LoadGovernor moves the active profile on simulated workloads.
+
+    python benchmarks/bench_load.py [--rounds N] [--tick S]
+
+Sampling is timed against the fake procfs from fakes.py, against the
+real /proc when readable, and against reading /proc/stat by path and
+splitting every line (open/read/close per sample). The traces advance
+the fake /proc/stat counters on a fake clock; passes when a sustained
+build is boosted within boost_seconds plus one tick, a quiet session is
+relaxed, and a noisy mixed load moves the profile at most
+MAX_MIXED_STEPS times.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.load import LoadGovernor  # noqa: E402
+from core.procstat import CpuLoadSampler  # noqa: E402
+from fakes import advance_cpu, make_fake_system  # noqa: E402
+
+TICKS_PER_SECOND = 100 * 8  # USER_HZ on 8 CPUs
+MAX_MIXED_STEPS = 2
+
+
+def by_path(procfs):
+    with open(os.path.join(procfs, "stat")) as f:
+        lines = [line.split() for line in f.read().splitlines()]
+    fields = [int(v) for v in lines[0][1:]]
+    return fields[3] + fields[4], sum(fields[:8])
+
+
+def measure(fn, rounds):
+    fn()  # warm up
+    start = time.perf_counter_ns()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter_ns() - start) / rounds / 1000
+
+
+def build(t):
+    # an idle minute, then a ten-minute compile
+    return (0.05, 0.0) if t < 60 else (0.95, 0.3)
+
+
+def quiet(t):
+    return 0.04, 0.0
+
+
+def mixed(t, rng=random.Random(7)):
+    # editor plus test runs: busy around the boost threshold, never sustained
+    return rng.uniform(0.3, 0.85), 0.02
+
+
+TRACES = {"build": build, "quiet": quiet, "mixed": mixed}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def ns(self):
+        return int(self.now * 1e9)
+
+
+def simulate(root, procfs, load, duration, tick):
+    clock = Clock()
+    sampler = CpuLoadSampler(procfs, clock=clock.ns)
+    governor = LoadGovernor(clock=clock)
+    sampler.sample()
+
+    changes = []
+    while clock.now < duration:
+        clock.now += tick
+        busy, stalled = load(clock.now)
+        ticks = int(TICKS_PER_SECOND * tick)
+        advance_cpu(root, int(ticks * busy), ticks - int(ticks * busy), int(stalled * tick * 1e6))
+        utilisation = sampler.sample()
+        if governor.update(utilisation, sampler.pressure):
+            changes.append((clock.now, governor.offset))
+    sampler.close()
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20000)
+    parser.add_argument("--tick", type=float, default=2.0)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="auto-idle-bench-")
+    procfs = make_fake_system(root)["AUTO_IDLE_PROCFS_ROOT"]
+
+    print(f"{'method':<28} {'us/sample':>10}")
+    fake = CpuLoadSampler(procfs)
+    print(f"{'CpuLoadSampler (fake)':<28} {measure(fake.sample, args.rounds):>10.2f}")
+    if os.access("/proc/stat", os.R_OK):
+        real = CpuLoadSampler("/proc")
+        print(f"{'CpuLoadSampler (/proc)':<28} {measure(real.sample, args.rounds):>10.2f}")
+        print(f"{'open/read/split (/proc)':<28} {measure(lambda: by_path('/proc'), args.rounds // 10):>10.2f}")
+        print(f"  /proc: {real.utilisation or 0:.0f}% busy, pressure "
+              f"{'n/a' if real.pressure is None else f'{real.pressure:.1f}%'}")
+    print()
+
+    boost_seconds = LoadGovernor().boost_seconds
+    results = {}
+    print(f"{'trace':<8} {'changes':<40}")
+    for name, load in TRACES.items():
+        changes = simulate(root, procfs, load, 600, args.tick)
+        results[name] = changes
+        print(f"{name:<8} {', '.join(f'{t:.0f}s:{o:+d}' for t, o in changes) or '-'}")
+
+    build_boost = [t for t, o in results["build"] if o > 0]
+    ok = (
+        bool(build_boost) and build_boost[0] <= 60 + boost_seconds + args.tick
+        and results["quiet"] and results["quiet"][-1][1] < 0
+        and len(results["mixed"]) <= MAX_MIXED_STEPS
+    )
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""
+Measure the per-call overhead of Metrics.timed().
+
+    python benchmarks/bench_metrics.py [calls]
+
+The budget is 1 µs per instrumented call.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.metrics import Metrics
+
+BUDGET_NS = 1000
+
+
+def probe():
+    return 0
+
+
+def best_of(fn, calls, rounds=5):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        for _ in range(calls):
+            fn()
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / calls
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    metrics = Metrics()
+    instrumented = metrics.timed("probe")(probe)
+
+    bare = best_of(probe, calls)
+    timed = best_of(instrumented, calls)
+    overhead = timed - bare
+
+    print(f"bare call      {bare:8.1f} ns")
+    print(f"instrumented   {timed:8.1f} ns")
+    print(f"overhead       {overhead:8.1f} ns")
+    ok = overhead < BUDGET_NS
+    print("PASS" if ok else f"FAIL (budget {BUDGET_NS} ns)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
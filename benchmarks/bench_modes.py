@@ -0,0 +1,91 @@
+"""
+Resident memory and CPU cost of the two ways to run the app: the Qt
+tray and the headless daemon (--daemon), each left running against the
+fake backends in fakes.py.
+
+    python benchmarks/bench_modes.py [--seconds S]
+
+The fake user is idle past the threshold, so without IdleMonitor
+watches both modes poll every min_interval (5 s) instead of sleeping
+up to 300 s, and the default 60 s window covers about a dozen ticks;
+the tick count (idle time probes) is printed with the results. CPU
+time includes the helper processes the app spawned and waited for,
+and is extrapolated to one hour.
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ENTRY_POINT = os.path.join(os.path.dirname(BENCH_DIR), "app-auto-idle-power.py")
+
+from fakes import idle_probes, make_fake_system  # noqa: E402
+
+MODES = {
+    "tray": [],
+    "daemon": ["--daemon"],
+}
+
+
+def rss_kb(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def cpu_seconds(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        # fields after the command name: utime stime cutime cstime are 14-17
+        fields = f.read().rsplit(")", 1)[1].split()
+    ticks = sum(int(v) for v in fields[11:15])
+    return ticks / os.sysconf("SC_CLK_TCK")
+
+
+def run_mode(args, env, root, seconds):
+    proc = subprocess.Popen(
+        [sys.executable, ENTRY_POINT, *args], env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        # skip startup, only the steady state is of interest
+        time.sleep(2)
+        start_cpu, start, start_ticks = cpu_seconds(proc.pid), time.monotonic(), idle_probes(root)
+        time.sleep(seconds)
+        cpu = cpu_seconds(proc.pid) - start_cpu
+        wall = time.monotonic() - start
+        ticks = idle_probes(root) - start_ticks
+        rss = rss_kb(proc.pid)
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    return rss, cpu / wall * 3600, ticks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=60)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="auto-idle-bench-")
+    # an hour idle: past the default 20 minute threshold
+    fake = make_fake_system(root, idle_ms=3600 * 1000)
+    env = dict(os.environ, **fake, XDG_RUNTIME_DIR=os.path.join(root, "run"))
+
+    print(f"{'mode':<8} {'RSS':>10} {'CPU/hour':>12} {'ticks':>6}")
+    for name, mode_args in MODES.items():
+        rss, cpu_per_hour, ticks = run_mode(mode_args, env, root, args.seconds)
+        print(f"{name:<8} {rss:>7} kB {cpu_per_hour:>10.2f} s {ticks:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Per-tick temperature sampling cost: one batched SensorArray pass over
+every input against reading every input by path (open/read/close).
+
+    python benchmarks/bench_sensors.py [rounds]
+
+Runs against the fake sysfs from fakes.py.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.sensors import SensorArray, discover_sensor_inputs  # noqa: E402
+from fakes import make_fake_system  # noqa: E402
+
+
+def by_path(inputs):
+    values = []
+    for _, path, scale in inputs:
+        with open(path) as f:
+            values.append(int(f.read()) * scale)
+    return values
+
+
+def measure(fn, rounds):
+    fn()  # warm up
+    start = time.perf_counter_ns()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter_ns() - start) / rounds / 1000
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    root = tempfile.mkdtemp(prefix="auto-idle-bench-")
+    sysfs = make_fake_system(root)["AUTO_IDLE_SYSFS_ROOT"]
+
+    array = SensorArray(sysfs)
+    count = array.discover()
+    inputs = discover_sensor_inputs(sysfs)
+
+    results = [
+        ("SensorArray.sample", count, measure(array.sample, rounds)),
+        ("open/read by path", count, measure(lambda: by_path(inputs), rounds // 10)),
+    ]
+
+    print(f"{'method':<22} {'sensors':>7} {'us/tick':>9} {'us/sensor':>10}")
+    for name, sensors, us in results:
+        print(f"{name:<22} {sensors:>7} {us:>9.2f} {us / sensors:>10.2f}")
+    print("sensors:", ", ".join(array.names))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Startup time and resident memory of the tray app, with the settings
+window never opened (the common session), opened, and closed again,
+plus time-to-tray-icon of the real entry point against a budget.
+
+    python benchmarks/bench_startup.py [--runs N] [--budget-ms MS]
+
+Every run is a fresh interpreter against the fake backends in fakes.py.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ENTRY_POINT = os.path.join(os.path.dirname(BENCH_DIR), "app-auto-idle-power.py")
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from fakes import make_fake_system  # noqa: E402
+
+
+def rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def child():
+    start = time.perf_counter()
+
+    from PyQt6.QtWidgets import QApplication
+    from gui.tray_app import TrayApp
+
+    app = QApplication(sys.argv)
+    tray_app = TrayApp(app)
+    tray_app.tray.show()
+    app.processEvents()
+    result = {"startup_ms": (time.perf_counter() - start) * 1e3, "rss_tray_kb": rss_kb()}
+
+    opened = time.perf_counter()
+    tray_app.show_settings()
+    app.processEvents()
+    result["open_window_ms"] = (time.perf_counter() - opened) * 1e3
+    result["rss_window_kb"] = rss_kb()
+
+    tray_app.window_settings.close()
+    app.processEvents()
+    app.sendPostedEvents(None, 0)  # deferred deletes
+    result["rss_closed_kb"] = rss_kb()
+
+    print(json.dumps(result))
+
+
+def time_to_tray(env, runs):
+    """Wall time from spawning the entry point until it reports the tray is up."""
+    env = dict(env, AUTO_IDLE_EXIT_AFTER_STARTUP="1")
+    walls, reported = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.check_output([sys.executable, ENTRY_POINT], env=env, text=True)
+        walls.append((time.perf_counter() - start) * 1e3)
+        for line in out.splitlines():
+            if line.startswith("tray_ready_ms="):
+                reported.append(float(line.split("=", 1)[1]))
+    walls.sort()
+    reported.sort()
+    return walls[len(walls) // 2], reported[len(reported) // 2] if reported else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1500)
+    args = parser.parse_args()
+    runs = args.runs
+
+    root = tempfile.mkdtemp(prefix="auto-idle-bench-")
+    env = dict(os.environ, **make_fake_system(root))
+
+    samples = []
+    for _ in range(runs):
+        out = subprocess.check_output(
+            [sys.executable, os.path.abspath(__file__), "--child"], env=env, text=True
+        )
+        samples.append(json.loads(out.strip().splitlines()[-1]))
+
+    for key in samples[0]:
+        values = sorted(s[key] for s in samples)
+        unit = "ms" if key.endswith("_ms") else "kB"
+        print(f"{key:<16} median {values[len(values) // 2]:10.1f} {unit}")
+
+    wall, in_process = time_to_tray(env, runs)
+    print(f"{'time_to_tray_ms':<16} median {wall:10.1f} ms (in process {in_process:.1f} ms)")
+    ok = wall < args.budget_ms
+    print("PASS" if ok else f"FAIL (budget {args.budget_ms:.0f} ms)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        child()
+    else:
+        sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+ThermalGovernor against simulated temperature traces: a first-order
+thermal model of the laptop driven by CPU load and the applied profile,
+sampled every tick with sensor noise, on a fake clock.
+
+    python benchmarks/bench_thermal.py [--tick S] [--limit C]
+
+For every trace it prints the peak temperature, time spent above the
+limit, how often the cap changed and the average profile level, with
+and without the governor. Passes when the governor keeps the model
+within 2 °C of the limit, and under a steady load (where any cap change
+beyond the backoff is flapping) changes the cap at most
+MAX_STEPS_PER_HOUR times. Bursty loads move the cap with every burst.
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.thermal import PROFILE_ORDER, ThermalGovernor  # noqa: E402
+
+AMBIENT_C = 35.0
+TAU_S = 40.0  # thermal time constant
+C_PER_W = 1.1
+# package power at full load per profile
+POWER_W = {"power-saver": 15.0, "balanced": 35.0, "performance": 58.0}
+IDLE_POWER_W = 4.0
+
+MAX_STEPS_PER_HOUR = 30
+
+
+def sustained(t):
+    return 1.0
+
+
+def bursty(t):
+    # a minute of compiling, a minute of reading
+    return 1.0 if (t // 60) % 2 == 0 else 0.05
+
+
+def ramp(t):
+    return min(t / 600, 1.0)
+
+
+def spike(t):
+    # one short heavy burst on a mostly idle machine
+    return 1.0 if 120 <= t < 165 else 0.05
+
+
+TRACES = {"sustained": sustained, "bursty": bursty, "ramp": ramp, "spike": spike}
+STEADY = ("sustained", "ramp")
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def simulate(load, duration, tick, limit, wanted="performance", governed=True, seed=1):
+    rng = random.Random(seed)
+    clock = Clock()
+    governor = ThermalGovernor(limit_c=limit, clock=clock)
+    temp = AMBIENT_C + 10
+    peak = temp
+    above = 0.0
+    level_time = 0.0
+
+    step = 1.0
+    while clock.now < duration:
+        profile = governor.clamp(wanted) if governed else wanted
+        power = IDLE_POWER_W + (POWER_W[profile] - IDLE_POWER_W) * load(clock.now)
+        target = AMBIENT_C + C_PER_W * power
+        temp += (target - temp) * step / TAU_S
+
+        peak = max(peak, temp)
+        if temp > limit:
+            above += step
+        level_time += PROFILE_ORDER.index(profile) * step
+
+        clock.now += step
+        if governed and clock.now % tick < step:
+            governor.update(round(temp + rng.uniform(-1, 1)), wanted)
+
+    return {
+        "peak_c": peak,
+        "above_s": above,
+        "steps_per_h": governor.steps * 3600 / duration if governed else 0.0,
+        "mean_level": level_time / duration,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tick", type=float, default=5)
+    parser.add_argument("--limit", type=float, default=85)
+    parser.add_argument("--duration", type=float, default=1800)
+    args = parser.parse_args()
+
+    print(f"{'trace':<10} {'mode':<9} {'peak':>7} {'above':>7} {'steps/h':>8} {'level':>6}")
+    ok = True
+    for name, load in TRACES.items():
+        for governed in (False, True):
+            r = simulate(load, args.duration, args.tick, args.limit, governed=governed)
+            mode = "governed" if governed else "free"
+            print(
+                f"{name:<10} {mode:<9} {r['peak_c']:6.1f}C {r['above_s']:6.0f}s "
+                f"{r['steps_per_h']:8.1f} {r['mean_level']:6.2f}"
+            )
+            if governed:
+                ok &= r["peak_c"] <= args.limit + 2
+                if name in STEADY:
+                    ok &= r["steps_per_h"] <= MAX_STEPS_PER_HOUR
+
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
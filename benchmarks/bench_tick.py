@@ -0,0 +1,169 @@
+"""
+Cost of one tick(), MainWindowAppGUI.apply() and the keyboard paths,
+run headless against fake backends (see fakes.py).
+
+    python benchmarks/bench_tick.py [--latency-ms N] [--rounds N]
+                                    [--save-baseline] [--tolerance 0.2]
+
+Reports wall time, CPU time (including child processes), read/write
+syscalls of this process and subprocess spawns per operation. Results
+are compared with benchmarks/baseline.json; --save-baseline replaces the
+entry for this latency. Exits with 1 on a regression and with 2 when
+there is no baseline to compare with.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from fakes import make_fake_system, set_idle_ms, set_temperature  # noqa: E402
+
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+
+
+def rw_syscalls():
+    try:
+        with open("/proc/self/io") as f:
+            fields = dict(line.split(": ") for line in f.read().splitlines())
+        return int(fields["syscr"]) + int(fields["syscw"])
+    except (OSError, KeyError, ValueError):
+        return 0
+
+
+def cpu_seconds():
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def measure(name, op, rounds, system):
+    op()  # warm up
+    start = (time.perf_counter(), cpu_seconds(), rw_syscalls(), system.subprocess_calls)
+    for i in range(rounds):
+        op(i)
+    end = (time.perf_counter(), cpu_seconds(), rw_syscalls(), system.subprocess_calls)
+
+    wall, cpu, syscalls, spawns = (
+        (b - a) / rounds for a, b in zip(start, end)
+    )
+    return {
+        "name": name,
+        "wall_ms": round(wall * 1e3, 3),
+        "cpu_ms": round(cpu * 1e3, 3),
+        "syscalls": round(syscalls, 1),
+        "spawns": round(spawns, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="auto-idle-bench-")
+    os.environ.update(make_fake_system(root, latency_ms=args.latency_ms))
+
+    # imported only now: config and core.system read the environment at import
+    from PyQt6.QtWidgets import QApplication
+
+    from config.config import settings
+    import core.system as system
+    from gui.tray_app import TrayApp
+
+    app = QApplication(sys.argv)
+    tray_app = TrayApp(app)
+    worker = tray_app.worker
+
+    processed = []
+    worker.snapshot_ready.connect(processed.append)
+
+    def drain():
+        # let queued worker signals reach the GUI thread
+        while worker.busy:
+            app.processEvents()
+        worker.wait()
+        app.processEvents()
+
+    def tick(i=0):
+        # alternate between active and idle to include transitions
+        set_idle_ms(root, 0 if i % 2 else settings.idle_minutes * 60 * 1000)
+        tray_app.tick()
+        drain()
+
+    def apply(i=0):
+        tray_app.window_settings.apply()
+        tray_app.timer.stop()
+        drain()
+
+    modes = ("power-saver", "balanced", "performance")
+
+    # no rate limit: every request is written in the timed call instead
+    # of being coalesced onto a timer thread
+    system.keyboard_queue.min_interval = 0
+
+    def keyboard_mode(i=0):
+        system.set_keyboard_color_for_mode(modes[i % len(modes)])
+
+    def keyboard_temperature(i=0):
+        set_temperature(root, 40 + (i % 10) * 5)
+        system.apply_temperature_keyboard_rgb()
+
+    tray_app.pipeline.policy.configure(0, 0, 0)
+    tray_app.show_settings()
+    results = [
+        measure("tick", tick, args.rounds, system),
+        measure("apply", apply, args.rounds, system),
+        measure("keyboard_mode", keyboard_mode, args.rounds, system),
+    ]
+    settings.temperature_rgb["enabled"] = True
+    results.append(measure("keyboard_temperature", keyboard_temperature, args.rounds, system))
+
+    print(f"backend latency {args.latency_ms} ms, {args.rounds} rounds")
+    print(f"{'operation':<22}{'wall ms':>10}{'cpu ms':>10}{'syscalls':>10}{'spawns':>8}")
+    for r in results:
+        print(f"{r['name']:<22}{r['wall_ms']:>10}{r['cpu_ms']:>10}{r['syscalls']:>10}{r['spawns']:>8}")
+
+    key = f"latency_{args.latency_ms}ms"
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE) as f:
+            baseline = json.load(f)
+
+    if args.save_baseline:
+        baseline[key] = {r["name"]: r for r in results}
+        with open(BASELINE_FILE, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"baseline saved to {BASELINE_FILE}")
+        return 0
+
+    reference = baseline.get(key, {})
+    missing = [r["name"] for r in results if r["name"] not in reference]
+    if missing:
+        print(f"NO BASELINE for {key}: {', '.join(missing)} (run with --save-baseline)")
+        return 2
+
+    regressions = []
+    for r in results:
+        ref = reference[r["name"]]
+        for field in ("wall_ms", "cpu_ms", "syscalls", "spawns"):
+            if r[field] > ref[field] * (1 + args.tolerance) and r[field] - ref[field] > 0.05:
+                regressions.append(f"{r['name']}.{field}: {ref[field]} -> {r[field]}")
+
+    if regressions:
+        print("REGRESSIONS:")
+        for line in regressions:
+            print("  " + line)
+        return 1
+    print(f"no regressions vs baseline (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Local stand-ins for the system the app talks to: gdbus, powerprofilesctl
+and asusctl as tiny shell scripts with a configurable delay, a fake
+sysfs with thermal zones, hwmon sensors and a battery, and a fake procfs
+with /proc/stat, /proc/pressure/cpu and processes. make_fake_system() returns the environment the
+app modules must be imported with.
+"""
+import os
+
+FAKE_COMMANDS = {
+    "gdbus": 'echo >> "{state}/gdbus.calls"; echo "(uint64 $(cat "{state}/idle_ms"),)"',
+    "powerprofilesctl": (
+        'if [ "$1" = "set" ]; then echo "$2" > "{state}/profile"; '
+        'else cat "{state}/profile"; fi'
+    ),
+    "asusctl": 'echo "$*" >> "{state}/asusctl.log"',
+}
+
+
+def _write(path, text, mode=0o644):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+    os.chmod(path, mode)
+
+
+def make_fake_system(root, latency_ms=0, thermal_zones=12, temp_c=55, idle_ms=0, cpu_cores=8):
+    state = os.path.join(root, "state")
+    bin_dir = os.path.join(root, "bin")
+    sysfs = os.path.join(root, "sys")
+    procfs = os.path.join(root, "proc")
+
+    _write(os.path.join(state, "idle_ms"), f"{idle_ms}\n")
+    _write(os.path.join(state, "profile"), "balanced\n")
+
+    delay = f"sleep {latency_ms / 1000:.3f}\n" if latency_ms else ""
+    for name, body in FAKE_COMMANDS.items():
+        _write(
+            os.path.join(bin_dir, name),
+            "#!/bin/sh\n" + delay + body.format(state=state) + "\n",
+            0o755,
+        )
+
+    # the package sensor is the last zone, as on most laptops
+    thermal = os.path.join(sysfs, "class", "thermal")
+    for i in range(thermal_zones):
+        zone = os.path.join(thermal, f"thermal_zone{i}")
+        last = i == thermal_zones - 1
+        _write(os.path.join(zone, "type"), "x86_pkg_temp\n" if last else f"acpitz{i}\n")
+        _write(os.path.join(zone, "temp"), f"{(temp_c if last else 40) * 1000}\n")
+
+    # coretemp package + cores, an NVMe drive and a battery
+    coretemp = os.path.join(sysfs, "class", "hwmon", "hwmon0")
+    _write(os.path.join(coretemp, "name"), "coretemp\n")
+    for i in range(cpu_cores + 1):
+        label = "Package id 0" if i == 0 else f"Core {i - 1}"
+        _write(os.path.join(coretemp, f"temp{i + 1}_label"), f"{label}\n")
+        _write(os.path.join(coretemp, f"temp{i + 1}_input"), f"{temp_c * 1000}\n")
+    nvme = os.path.join(sysfs, "class", "hwmon", "hwmon1")
+    _write(os.path.join(nvme, "name"), "nvme\n")
+    _write(os.path.join(nvme, "temp1_label"), "Composite\n")
+    _write(os.path.join(nvme, "temp1_input"), "38850\n")
+    _write(os.path.join(sysfs, "class", "power_supply", "BAT0", "temp"), "301\n")
+
+    _write_proc(procfs, 0, 0, 0)
+
+    return {
+        "PATH": bin_dir + os.pathsep + os.environ.get("PATH", ""),
+        "HOME": os.path.join(root, "home"),
+        "XDG_STATE_HOME": os.path.join(root, "home", ".local", "state"),
+        "AUTO_IDLE_SYSFS_ROOT": sysfs,
+        "AUTO_IDLE_PROCFS_ROOT": procfs,
+        "AUTO_IDLE_NO_DBUS": "1",
+        "QT_QPA_PLATFORM": "offscreen",
+    }
+
+
+def idle_probes(root):
+    """How many times the fake gdbus was asked for the idle time."""
+    try:
+        with open(os.path.join(root, "state", "gdbus.calls")) as f:
+            return sum(1 for _ in f)
+    except OSError:
+        return 0
+
+
+def set_idle_ms(root, idle_ms):
+    _write(os.path.join(root, "state", "idle_ms"), f"{idle_ms}\n")
+
+
+def set_temperature(root, temp_c):
+    thermal = os.path.join(root, "sys", "class", "thermal")
+    last = sorted(os.listdir(thermal), key=lambda z: int(z.removeprefix("thermal_zone")))[-1]
+    _write(os.path.join(thermal, last, "temp"), f"{temp_c * 1000}\n")
+
+
+def _write_proc(procfs, busy, idle, stall_us):
+    # user nice system idle iowait irq softirq steal guest guest_nice
+    cpus = [f"cpu{i} 0 0 0 0 0 0 0 0 0 0" for i in range(8)]
+    _write(
+        os.path.join(procfs, "stat"),
+        f"cpu  {busy} 0 0 {idle} 0 0 0 0 0 0\n" + "\n".join(cpus) + "\nintr 0\nctxt 0\n",
+    )
+    _write(
+        os.path.join(procfs, "pressure", "cpu"),
+        f"some avg10=0.00 avg60=0.00 avg300=0.00 total={stall_us}\n"
+        "full avg10=0.00 avg60=0.00 avg300=0.00 total=0\n",
+    )
+
+
+def advance_cpu(root, busy_ticks, idle_ticks, stall_us=0):
+    """Add CPU time to the fake /proc/stat and pressure counters."""
+    procfs = os.path.join(root, "proc")
+    with open(os.path.join(procfs, "stat")) as f:
+        fields = f.readline().split()
+    with open(os.path.join(procfs, "pressure", "cpu")) as f:
+        stall = int(f.readline().rsplit("total=", 1)[1])
+    _write_proc(procfs, int(fields[1]) + busy_ticks, int(fields[4]) + idle_ticks, stall + stall_us)
+
+
+def add_process(root, pid, name, exe=None):
+    """A /proc/<pid> with comm and an exe link; exe=False for a kernel thread."""
+    base = os.path.join(root, "proc", str(pid))
+    _write(os.path.join(base, "comm"), f"{name[:15]}\n")
+    if exe is not False:
+        os.symlink(exe or f"/usr/bin/{name}", os.path.join(base, "exe"))
+
+
+def set_comm(root, pid, name):
+    """What exec() does to /proc/<pid>/comm."""
+    _write(os.path.join(root, "proc", str(pid), "comm"), f"{name[:15]}\n")
+
+
+def remove_process(root, pid):
+    base = os.path.join(root, "proc", str(pid))
+    for entry in os.listdir(base):
+        os.unlink(os.path.join(base, entry))
+    os.rmdir(base)
@@ -2,9 +2,10 @@ import os
 import sys
 from typing import Literal
 
-from pydantic import BaseSettings, Field
+from pydantic import BaseSettings, Field, validator
 
 from config.config_values import DEFAULT_CONFIG, APP_AUTHOR
+from core.tiers import KEYBOARD_OFF, KEYBOARD_ON
 
 CONFIG_DIR = os.path.expanduser("~/.config/auto-idle")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
@@ -12,6 +13,22 @@ CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
 AUTOSTART_DIR = os.path.expanduser("~/.config/autostart")
 AUTOSTART_FILE = os.path.join(AUTOSTART_DIR, "auto-idle.desktop")
 
+# overridable so the sensor code can run against a fake tree
+SYSFS_ROOT = os.environ.get("AUTO_IDLE_SYSFS_ROOT", "/sys")
+PROCFS_ROOT = os.environ.get("AUTO_IDLE_PROCFS_ROOT", "/proc")
+
+# AUTO_IDLE_NO_DBUS=1 forces the subprocess fallbacks (benchmarks, debugging)
+USE_DBUS = not os.environ.get("AUTO_IDLE_NO_DBUS")
+
+# node_exporter textfile collector output, disabled when empty
+METRICS_FILE = os.environ.get("AUTO_IDLE_METRICS_FILE", "")
+METRICS_EXPORT_INTERVAL = 60
+
+# per-user runtime files: daemon pid file and the control socket
+RUNTIME_DIR = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{os.getuid()}", "auto-idle")
+DAEMON_PID_FILE = os.path.join(RUNTIME_DIR, "daemon.pid")
+CONTROL_SOCKET = os.path.join(RUNTIME_DIR, "control.sock")
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 APP_EXEC = f"{sys.executable} {os.path.join(BASE_DIR, os.path.basename(__file__))}"
 
@@ -20,14 +37,50 @@ class Settings(BaseSettings):
     idle_minutes: int = DEFAULT_CONFIG["idle_minutes"]
     active_mode: Literal["performance", "balanced", "power-saver"] = DEFAULT_CONFIG["active_mode"]
     idle_mode: Literal["performance", "balanced", "power-saver"] = DEFAULT_CONFIG["idle_mode"]
+    idle_tiers: list[dict] = Field(default_factory=lambda: list(DEFAULT_CONFIG["idle_tiers"]))
+    app_rules: list[dict] = Field(default_factory=lambda: list(DEFAULT_CONFIG["app_rules"]))
+
+    hysteresis_seconds: int = DEFAULT_CONFIG["hysteresis_seconds"]
+    min_dwell_seconds: int = DEFAULT_CONFIG["min_dwell_seconds"]
+    grace_seconds: int = DEFAULT_CONFIG["grace_seconds"]
+
+    release_window_on_close: bool = DEFAULT_CONFIG["release_window_on_close"]
 
     # IMPORTANT: use default_factory for mutable defaults
     keyboard: dict = Field(default_factory=lambda: DEFAULT_CONFIG["keyboard"].copy())
     temperature_rgb: dict = Field(default_factory=lambda: DEFAULT_CONFIG["temperature_rgb"].copy())
+    thermal: dict = Field(default_factory=lambda: DEFAULT_CONFIG["thermal"].copy())
+    load: dict = Field(default_factory=lambda: DEFAULT_CONFIG["load"].copy())
     app_author: dict = Field(default_factory=lambda: APP_AUTHOR.copy())
 
     last_idle_seconds: int = 0
 
+    @validator("idle_tiers", each_item=True)
+    def check_idle_tier(cls, tier):
+        # rejected here rather than failing with KeyError at tick time
+        if not isinstance(tier, dict):
+            raise ValueError(f"idle tier must be an object: {tier!r}")
+        minutes = tier.get("minutes")
+        if isinstance(minutes, bool) or not isinstance(minutes, (int, float)) or minutes <= 0:
+            raise ValueError(f"idle tier needs minutes > 0: {tier!r}")
+        if tier.get("profile") not in ("performance", "balanced", "power-saver"):
+            raise ValueError(f"idle tier has an unknown profile: {tier!r}")
+        if tier.get("keyboard", KEYBOARD_ON) not in (KEYBOARD_ON, KEYBOARD_OFF):
+            raise ValueError(f"idle tier keyboard must be on or off: {tier!r}")
+        return tier
+
+    @validator("app_rules", each_item=True)
+    def check_app_rule(cls, rule):
+        # a malformed rule would otherwise fail every snapshot
+        if not isinstance(rule, dict):
+            raise ValueError(f"app rule must be an object: {rule!r}")
+        apps = rule.get("apps")
+        if not isinstance(apps, list) or not apps or not all(isinstance(app, str) and app for app in apps):
+            raise ValueError(f"app rule needs a non-empty list of app names: {rule!r}")
+        if rule.get("profile") not in ("performance", "balanced", "power-saver"):
+            raise ValueError(f"app rule has an unknown profile: {rule!r}")
+        return rule
+
     class Config:
         env_file = None
         case_sensitive = True
@@ -2,26 +2,100 @@ import json
 import os
 from typing import TYPE_CHECKING
 
-from config.config import CONFIG_FILE, CONFIG_DIR, Settings
+from config.config import CONFIG_FILE, CONFIG_DIR, Settings, settings
+from core.event_log import event_log
 
 if TYPE_CHECKING:
     from config import Settings
 
 
-def load_settings() -> Settings:
+def load_settings(validate: bool = True) -> Settings:
+    """
+    With validate=False the file is only parsed and the values are taken
+    as they are (Settings.construct); call validate_settings() later to
+    get the full pydantic check off the startup path.
+    """
     if os.path.exists(CONFIG_FILE):
         try:
             with open(CONFIG_FILE, "r") as f:
                 data = json.load(f)
+            if not validate:
+                return Settings.construct(**{k: v for k, v in data.items() if k in Settings.__fields__})
             return Settings(**data)
         except Exception as e:
-            print("Failed to load config, using defaults:", e)
+            event_log.error("settings", "Failed to load config, using defaults: %s", e)
 
     return Settings()
 
 
+def _assign(target: Settings, source: Settings) -> Settings:
+    for name in source.__fields__:
+        setattr(target, name, getattr(source, name))
+    return target
+
+
+def reload_settings(target: Settings = settings, validate: bool = True) -> Settings:
+    """
+    Load config.json into the shared settings object in place, so every
+    module holding a reference to it sees the new values.
+    """
+    return _assign(target, load_settings(validate))
+
+
+def validate_settings(target: Settings = settings) -> bool:
+    """
+    Run the pydantic validation skipped by reload_settings(validate=False).
+    Invalid settings are replaced with defaults, as load_settings() does.
+    """
+    try:
+        _assign(target, Settings(**target.dict()))
+        return True
+    except Exception as e:
+        event_log.error("settings", "Failed to validate config, using defaults: %s", e)
+        _assign(target, Settings())
+        return False
+
+
+def reload_changed(target: Settings = settings) -> set[str]:
+    """
+    Validate config.json and assign only the fields that differ from
+    target. Returns their names, so callers rebuild just the state
+    derived from them. A missing or invalid file keeps the current
+    settings (it may be half-written by an editor).
+    """
+    try:
+        with open(CONFIG_FILE, "r") as f:
+            source = Settings(**json.load(f))
+    except Exception as e:
+        event_log.error("settings", "Failed to reload config, keeping current settings: %s", e)
+        return set()
+
+    changed = set()
+    for name in source.__fields__:
+        value = getattr(source, name)
+        if getattr(target, name) != value:
+            event_log.debug("settings", "%s: %r -> %r", name, getattr(target, name), value)
+            setattr(target, name, value)
+            changed.add(name)
+    return changed
+
+
 def save_settings(settings: Settings) -> None:
+    """
+    Write config.json atomically: a crash mid-write leaves the old file,
+    and watchers only ever see a complete one (IN_MOVED_TO).
+    """
     os.makedirs(CONFIG_DIR, exist_ok=True)
-    with open(CONFIG_FILE, "w") as f:
+    tmp = f"{CONFIG_FILE}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
         # json.dump(settings.model_dump(), f, indent=2)
         json.dump(settings.dict(), f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, CONFIG_FILE)
+
+    dir_fd = os.open(CONFIG_DIR, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
@@ -22,6 +22,42 @@ DEFAULT_CONFIG = {
     "active_mode": "balanced",
     "idle_mode": "power-saver",
 
+    # deeper tiers after idle_minutes/idle_mode, see core.tiers, e.g.
+    # {"minutes": 60, "profile": "power-saver", "keyboard": "off"}
+    "idle_tiers": [],
+
+    # active profile while a matching process runs, first rule wins, see
+    # core.procscan, e.g. {"apps": ["cargo", "gcc"], "profile": "performance"}
+    "app_rules": [],
+
+    # transition state machine, see core.policy.IdlePolicy
+    "hysteresis_seconds": 30,
+    "min_dwell_seconds": 30,
+    "grace_seconds": 5,
+
+    # cap the profile while the CPU runs hot, see core.thermal.ThermalGovernor
+    "thermal": {
+        "enabled": False,
+        "limit_c": 85,
+        "headroom_c": 10,
+        "horizon_seconds": 30,
+        "dwell_seconds": 30,
+    },
+
+    # step the active profile up under sustained load and down when
+    # nearly idle, see core.load.LoadGovernor (percentages)
+    "load": {
+        "enabled": False,
+        "boost_above": 75,
+        "relax_below": 15,
+        "pressure_above": 20,
+        "boost_seconds": 10,
+        "relax_seconds": 60,
+    },
+
+    # destroy the settings window on close instead of keeping it resident
+    "release_window_on_close": True,
+
     "keyboard": {
         "enabled": True,
         "modes": {
@@ -47,6 +83,10 @@ DEFAULT_CONFIG = {
     # }
     "temperature_rgb": {
         "enabled": False,
+        # interpolate colors between points instead of stepping
+        "gradient": False,
+        # "cpu" or any name from core.sensors.discover_sensor_inputs()
+        "sensor": "cpu",
         "points": {
             "40": "#66ff00",
             "45": "#99ff00",
@@ -0,0 +1,98 @@
+import ctypes
+import ctypes.util
+import os
+import struct
+
+from config.config import CONFIG_FILE
+from core.event_log import event_log
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+
+# struct inotify_event without the trailing name
+_EVENT = struct.Struct("iIII")
+
+
+class ConfigWatcher:
+    """
+    Tells when config.json changed on disk.
+
+    inotify watches the config directory rather than the file, since
+    save_settings() replaces the file by rename. Owners add fileno() to
+    their event loop and call read_events() when it is readable. Without
+    inotify, fileno() is None and owners call changed() every
+    POLL_INTERVAL seconds instead, which compares stat() results.
+    """
+
+    POLL_INTERVAL = 5
+    # editors write in several steps; reload once they are done
+    DEBOUNCE_MS = 200
+
+    def __init__(self, path=CONFIG_FILE):
+        self.path = path
+        self.name = os.fsencode(os.path.basename(path))
+        self.fd = None
+        self.signature = self._stat()
+        self._open_inotify()
+
+    def _open_inotify(self):
+        directory = os.path.dirname(self.path)
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            os.makedirs(directory, exist_ok=True)
+            mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+            if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+                err = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(err, "inotify_add_watch failed")
+        except (OSError, AttributeError) as e:
+            event_log.warning("config", "inotify unavailable, polling %s: %s", self.path, e)
+            return
+        self.fd = fd
+
+    def fileno(self) -> int | None:
+        return self.fd
+
+    def read_events(self) -> bool:
+        """Drain pending inotify events; True if one concerned the config file."""
+        touched = False
+        while True:
+            try:
+                data = os.read(self.fd, 4096)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = _EVENT.unpack_from(data, offset)
+                start = offset + _EVENT.size
+                if data[start:start + length].rstrip(b"\0") == self.name:
+                    touched = True
+                offset = start + length
+        return touched
+
+    def changed(self) -> bool:
+        """True once per new version of the file (inode, size or mtime differ)."""
+        signature = self._stat()
+        if signature == self.signature:
+            return False
+        self.signature = signature
+        return True
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
@@ -0,0 +1,100 @@
+from PyQt6.QtCore import QMetaType
+from PyQt6.QtDBus import QDBusArgument, QDBusConnection, QDBusMessage, QDBusVariant
+
+PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+OBJECT_MANAGER_INTERFACE = "org.freedesktop.DBus.ObjectManager"
+
+# asusd 6.x renamed its bus name; try the new one first
+ASUSD_SERVICES = (
+    ("xyz.ljones.Asusd", "/", "xyz.ljones.Aura"),
+    ("org.asuslinux.Daemon", "/", "org.asuslinux.Aura"),
+)
+
+# asusctl -k names -> asusd Brightness enum
+BRIGHTNESS_LEVELS = {"off": 0, "low": 1, "med": 2, "high": 3}
+
+AURA_MODE_STATIC = 0
+AURA_ZONE_NONE = 0
+
+
+class AsusdKeyboard:
+    """
+    System bus client for the asusd Aura interface.
+
+    Color and brightness are written as two property sets sent back to
+    back and awaited together, i.e. one round trip on a connection that
+    stays open, instead of two sequential asusctl processes.
+    """
+
+    def __init__(self, bus: QDBusConnection | None = None):
+        self._bus = bus if bus is not None else QDBusConnection.systemBus()
+        self._target = None
+        self._discover()
+
+    def is_available(self) -> bool:
+        return self._target is not None
+
+    def disable(self):
+        self._target = None
+
+    def _discover(self):
+        if not self._bus.isConnected():
+            return
+
+        for service, root, interface in ASUSD_SERVICES:
+            msg = QDBusMessage.createMethodCall(
+                service, root, OBJECT_MANAGER_INTERFACE, "GetManagedObjects"
+            )
+            reply = self._bus.call(msg)
+            if reply.type() != QDBusMessage.MessageType.ReplyMessage:
+                continue
+
+            objects = reply.arguments()[0] or {}
+            for path, interfaces in objects.items():
+                if interface in interfaces:
+                    self._target = (service, str(path), interface)
+                    return
+
+    def _set_property(self, name, value):
+        service, path, interface = self._target
+        msg = QDBusMessage.createMethodCall(service, path, PROPERTIES_INTERFACE, "Set")
+        msg.setArguments([interface, name, QDBusVariant(value)])
+        return self._bus.asyncCall(msg)
+
+    @staticmethod
+    def _effect(color: str):
+        r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+        arg = QDBusArgument()
+        arg.beginStructure()
+        arg.add(AURA_MODE_STATIC, QMetaType.Type.UInt.value)
+        arg.add(AURA_ZONE_NONE, QMetaType.Type.UInt.value)
+        for rgb in ((r, g, b), (0, 0, 0)):
+            arg.beginStructure()
+            for channel in rgb:
+                arg.add(channel, QMetaType.Type.UChar.value)
+            arg.endStructure()
+        arg.add("Med", QMetaType.Type.QString.value)
+        arg.add("Right", QMetaType.Type.QString.value)
+        arg.endStructure()
+        return arg
+
+    def set_color(self, color: str, brightness: str):
+        """Set a static color (#rrggbb) and brightness (off/low/med/high)."""
+        if not self._target:
+            raise RuntimeError("asusd is not available")
+
+        pending = (
+            self._set_property("LedModeData", self._effect(color)),
+            self._set_property(
+                "Brightness",
+                QDBusArgument(
+                    BRIGHTNESS_LEVELS.get(brightness, BRIGHTNESS_LEVELS["med"]),
+                    QMetaType.Type.UInt.value,
+                ),
+            ),
+        )
+        for call in pending:
+            call.waitForFinished()
+            if call.isError():
+                raise RuntimeError(f"asusd write failed: {call.error().message()}")
@@ -0,0 +1,57 @@
+# one entry per degree, 0..127 °C covers every sensor we read
+TEMP_LUT_SIZE = 128
+
+
+def _parse_hex(color):
+    color = (color or "").strip().lower()
+    if len(color) != 7 or not all(c in "#0123456789abcdef" for c in color):
+        return None
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def _mix(start, end, ratio):
+    # both colors are validated before mixing
+    a, b = _parse_hex(start), _parse_hex(end)
+    return "#" + "".join(
+        f"{round(x + (y - x) * ratio):02x}" for x, y in zip(a, b)
+    )
+
+
+def compile_temperature_lut(points: dict, gradient: bool = False) -> tuple:
+    """
+    Compile temperature_rgb["points"] ({"40": "#66ff00", ...}) into a
+    tuple with one HEX color per degree, so a lookup is lut[temp].
+
+    Below the first point the first color is used, at or above a point
+    its color holds until the next one. With gradient=True the colors
+    are interpolated linearly between neighbouring points instead.
+    """
+    curve = sorted((int(t), color.lower()) for t, color in points.items())
+    if not curve:
+        return ()
+
+    lut = []
+    idx = 0
+    for deg in range(TEMP_LUT_SIZE):
+        while idx + 1 < len(curve) and deg >= curve[idx + 1][0]:
+            idx += 1
+
+        t0, c0 = curve[idx]
+        color = c0
+        if gradient and deg > t0 and idx + 1 < len(curve):
+            t1, c1 = curve[idx + 1]
+            if _parse_hex(c0) and _parse_hex(c1):
+                color = _mix(c0, c1, (deg - t0) / (t1 - t0))
+        lut.append(color)
+
+    return tuple(lut)
+
+
+def lookup_temperature_color(lut: tuple, temp_c: int) -> str | None:
+    if not lut:
+        return None
+    if temp_c < 0:
+        return lut[0]
+    if temp_c >= TEMP_LUT_SIZE:
+        return lut[-1]
+    return lut[temp_c]
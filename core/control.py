@@ -0,0 +1,301 @@
+"""
+Control API of the running instance (daemon or tray) on a Unix socket,
+and the `auto-idle ctl` client.
+
+Every message is one frame: a 4-byte big-endian length followed by a
+UTF-8 JSON object. Requests look like {"cmd": "pause", "args": ["10m"]},
+responses always carry "ok" and either the result fields or "error".
+Requests are answered from state the instance already holds; nothing
+here calls into the system backends except force/reload, which hand
+the work to the owner.
+"""
+import json
+import math
+import os
+import socket
+import struct
+import sys
+import time
+
+from core.metrics import metrics
+
+HEADER = struct.Struct(">I")
+MAX_FRAME = 64 * 1024
+
+PROFILES = ("performance", "balanced", "power-saver")
+COMMANDS = ("status", "pause", "force", "reload", "metrics")
+
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600}
+
+
+class ControlError(Exception):
+    pass
+
+
+def encode_frame(message: dict) -> bytes:
+    payload = json.dumps(message, separators=(",", ":")).encode()
+    if len(payload) > MAX_FRAME:
+        raise ControlError("frame too large")
+    return HEADER.pack(len(payload)) + payload
+
+
+def decode_frame(payload: bytes) -> dict:
+    message = json.loads(payload)
+    if not isinstance(message, dict):
+        raise ControlError("frame is not an object")
+    return message
+
+
+def split_frames(buffer: bytearray) -> list[bytes]:
+    """Remove and return the complete frame payloads at the start of buffer."""
+    frames = []
+    while len(buffer) >= HEADER.size:
+        (size,) = HEADER.unpack_from(buffer)
+        if size > MAX_FRAME:
+            raise ControlError("frame too large")
+        end = HEADER.size + size
+        if len(buffer) < end:
+            break
+        frames.append(bytes(buffer[HEADER.size:end]))
+        del buffer[:end]
+    return frames
+
+
+def parse_duration(text: str) -> float:
+    """'90', '90s', '10m', '2h' -> seconds; 'off' or '0' resumes."""
+    text = text.strip().lower()
+    if text in ("off", "resume"):
+        return 0.0
+    if text in ("inf", "forever"):
+        return math.inf
+    scale = DURATION_UNITS.get(text[-1:])
+    try:
+        value = float(text[:-1] if scale else text)
+    except ValueError:
+        raise ControlError(f"invalid duration: {text}") from None
+    if value < 0:
+        raise ControlError(f"invalid duration: {text}")
+    return value * (scale or 1)
+
+
+class ControlState:
+    """
+    Manual overrides set through the control socket. While paused the
+    owner keeps updating its idle policy but applies no profile; a
+    forced profile is held until the pause ends.
+
+    Expiry is judged from paused_until against the clock, so a pause
+    that ended while nobody was evaluating, or was lifted with
+    `pause 0`, is still reported once by resumed().
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.paused_until = 0.0
+        self.forced_profile = None
+        # an override was set and its end not yet reported by resumed()
+        self.overridden = False
+
+    def pause(self, seconds: float):
+        if seconds > 0:
+            self.paused_until = self.clock() + seconds
+            self.overridden = True
+        else:
+            # lifted early: resumed() re-plans on the next evaluation
+            self.paused_until = 0.0
+
+    def force(self, profile: str, seconds: float = math.inf):
+        self.forced_profile = profile
+        self.pause(seconds)
+
+    @property
+    def paused(self) -> bool:
+        return self.clock() < self.paused_until
+
+    @property
+    def remaining(self) -> float:
+        return max(self.paused_until - self.clock(), 0.0)
+
+    def resumed(self) -> bool:
+        """True once, on the first call after a pause has ended."""
+        if not self.overridden or self.paused:
+            return False
+        self.overridden = False
+        self.forced_profile = None
+        return True
+
+    def as_dict(self) -> dict:
+        remaining = self.remaining
+        return {
+            "paused": remaining > 0,
+            "paused_for": None if math.isinf(remaining) else round(remaining),
+            "forced_profile": self.forced_profile,
+        }
+
+
+def status_fields(mode: str, snapshot, pipeline, scheduler, keyboard=None) -> dict:
+    """The cached state both owners report for `status`."""
+    policy = pipeline.policy
+    fields = {
+        "mode": mode,
+        "pid": os.getpid(),
+        "state": policy.state,
+        "settling": policy.settling,
+        "tier": pipeline.tiers.index,
+        "thermal_cap": pipeline.thermal.capped_profile,
+        "load_offset": pipeline.load.offset,
+        "transitions": dict(policy.transitions),
+        "wakeups_per_hour": round(scheduler.wakeups_per_hour, 1),
+    }
+    if keyboard is not None:
+        fields["keyboard"] = keyboard.stats()
+    if snapshot is not None:
+        fields.update(
+            profile=snapshot.profile,
+            idle_seconds=snapshot.idle_seconds,
+            cpu_temp=snapshot.cpu_temp,
+            cpu_load=snapshot.cpu_load,
+            cpu_pressure=snapshot.cpu_pressure,
+            app_profile=snapshot.app_profile,
+            snapshot_age=round(snapshot.age, 1),
+        )
+    return fields
+
+
+def dispatch(owner, request: dict) -> dict:
+    """
+    Run one request against owner, which provides:
+      pipeline          ProfilePipeline, holding the ControlState
+      control_status()  dict of cached state
+      force_profile(p)  apply p now
+      reload_config()   re-read config.json
+      replan()          evaluate again soon, e.g. to schedule a pause's end
+    """
+    try:
+        cmd = request.get("cmd")
+        args = request.get("args") or []
+        control = owner.pipeline.control
+
+        if cmd == "status":
+            return {"ok": True, **owner.control_status(), **control.as_dict()}
+
+        if cmd == "pause":
+            control.pause(parse_duration(args[0]) if args else math.inf)
+            owner.replan()
+            return {"ok": True, **control.as_dict()}
+
+        if cmd == "force":
+            if not args or args[0] not in PROFILES:
+                raise ControlError(f"profile must be one of {', '.join(PROFILES)}")
+            seconds = parse_duration(args[1]) if len(args) > 1 else math.inf
+            control.force(args[0], seconds)
+            owner.force_profile(args[0])
+            owner.replan()
+            return {"ok": True, **control.as_dict()}
+
+        if cmd == "reload":
+            owner.reload_config()
+            return {"ok": True}
+
+        if cmd == "metrics":
+            return {
+                "ok": True,
+                "metrics": {name: stats.as_dict() for name, stats in sorted(metrics.probes.items())},
+            }
+
+        raise ControlError(f"unknown command: {cmd}")
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+
+def prepare_socket_path(path: str) -> bool:
+    """
+    Make room for a new server at path. False if another instance is
+    already serving it; a stale socket file is removed.
+    """
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    if not os.path.exists(path):
+        return True
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.connect(path)
+        return False
+    except OSError:
+        os.remove(path)
+        return True
+
+
+async def serve(path: str, handle):
+    """asyncio server for the daemon; handle(request) -> response."""
+    import asyncio
+
+    async def client(reader, writer):
+        try:
+            while True:
+                (size,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+                if size > MAX_FRAME:
+                    break
+                payload = await reader.readexactly(size)
+                try:
+                    response = handle(decode_frame(payload))
+                except Exception as e:
+                    response = {"ok": False, "error": str(e)}
+                writer.write(encode_frame(response))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_unix_server(client, path)
+    os.chmod(path, 0o600)
+    return server
+
+
+def request(cmd: str, *args, path: str | None = None, timeout=2.0) -> dict:
+    if path is None:
+        from config.config import CONTROL_SOCKET as path
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(encode_frame({"cmd": cmd, "args": list(args)}))
+        buffer = bytearray()
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                raise ControlError("connection closed")
+            buffer += chunk
+            frames = split_frames(buffer)
+            if frames:
+                return decode_frame(frames[0])
+
+
+USAGE = """usage: auto-idle ctl <command> [args]
+
+  status                     current state of the running instance
+  pause <duration>           stop switching profiles, e.g. 90s, 10m, 2h; 0 resumes
+  force <profile> [duration] apply a profile and hold it (until 'pause 0')
+  reload                     re-read config.json
+  metrics                    per-probe latency statistics
+"""
+
+
+def cli(argv: list[str]) -> int:
+    if not argv or argv[0] not in COMMANDS:
+        print(USAGE, end="", file=sys.stderr)
+        return 2
+
+    try:
+        response = request(argv[0], *argv[1:])
+    except (OSError, ControlError) as e:
+        print(f"auto-idle is not running or not reachable: {e}", file=sys.stderr)
+        return 1
+
+    if not response.get("ok"):
+        print(f"error: {response.get('error')}", file=sys.stderr)
+        return 1
+
+    response.pop("ok")
+    print(json.dumps(response, indent=2))
+    return 0
@@ -0,0 +1,202 @@
+"""
+Headless mode: the idle policy, profile switching and keyboard RGB
+without Qt, driven by an asyncio loop. Started with
+`app-auto-idle-power.py --daemon`; a tray started while the daemon runs
+only displays state (see TrayApp.client_mode).
+"""
+import asyncio
+import os
+import signal
+from concurrent.futures import ThreadPoolExecutor
+
+from config.config import CONTROL_SOCKET, DAEMON_PID_FILE
+from config.config_service import reload_changed, reload_settings
+from config.config_watcher import ConfigWatcher
+from core.control import dispatch, prepare_socket_path, serve, status_fields
+from core.event_log import event_log, setup_sink
+from core.owner import PipelineOwner
+from core.pipeline import ProfilePipeline
+from core.scheduler import AdaptiveScheduler
+from core.system import apply_temperature_keyboard_rgb, collect_snapshot, rebuild_temperature_lut, set_profile
+import core.system as system
+
+
+def daemon_running(path=DAEMON_PID_FILE) -> int | None:
+    """Pid of the running daemon, or None."""
+    try:
+        with open(path) as f:
+            pid = int(f.read().strip())
+        os.kill(pid, 0)
+    except (OSError, ValueError):
+        return None
+    return pid
+
+
+def write_pid_file(path=DAEMON_PID_FILE):
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    with open(path, "w") as f:
+        f.write(f"{os.getpid()}\n")
+
+
+def remove_pid_file(path=DAEMON_PID_FILE):
+    try:
+        if daemon_running(path) == os.getpid():
+            os.remove(path)
+    except OSError:
+        pass
+
+
+class Daemon(PipelineOwner):
+    """
+    Same tick as TrayApp: sample, update the policy, write, sleep for
+    what the scheduler allows. Probes run in the default executor and
+    writes on a single thread, so the loop only ever waits.
+    SIGTERM/SIGINT stop it; config.json is reloaded when it changes on
+    disk or on SIGHUP; `auto-idle ctl` talks to it through the control
+    socket.
+    """
+
+    def __init__(self):
+        self.pipeline = ProfilePipeline()
+        self.scheduler = AdaptiveScheduler()
+        self.config_watcher = None
+        self.config_check = None
+        self.writes = ThreadPoolExecutor(max_workers=1, thread_name_prefix="write")
+        self.last_snapshot = None
+        self.loop = None
+        self.stopping = None
+        self.wakeup = None
+
+    def run(self) -> int:
+        return asyncio.run(self.main())
+
+    async def main(self) -> int:
+        self.loop = asyncio.get_running_loop()
+        self.stopping = asyncio.Event()
+        self.wakeup = asyncio.Event()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            self.loop.add_signal_handler(sig, self.stop)
+        self.loop.add_signal_handler(signal.SIGHUP, self.reload_config)
+
+        self.config_watcher = ConfigWatcher()
+        if self.config_watcher.fileno() is not None:
+            self.loop.add_reader(self.config_watcher.fileno(), self.on_config_event)
+        else:
+            self.loop.call_later(ConfigWatcher.POLL_INTERVAL, self.poll_config)
+
+        write_pid_file()
+        server = None
+        if prepare_socket_path(CONTROL_SOCKET):
+            server = await serve(CONTROL_SOCKET, lambda request: dispatch(self, request))
+        else:
+            event_log.warning("daemon", "Control socket %s is in use", CONTROL_SOCKET)
+
+        event_log.info("daemon", "Daemon started (pid %s)", os.getpid())
+        try:
+            while not self.stopping.is_set():
+                interval = await self.tick()
+                await self.sleep(interval)
+        finally:
+            if server is not None:
+                server.close()
+                # Python >= 3.13 already unlinks it on close
+                if os.path.exists(CONTROL_SOCKET):
+                    os.remove(CONTROL_SOCKET)
+            if self.config_watcher.fileno() is not None:
+                self.loop.remove_reader(self.config_watcher.fileno())
+            self.config_watcher.close()
+            self.writes.shutdown(wait=True)
+            remove_pid_file()
+            event_log.info("daemon", "Daemon stopped")
+        return 0
+
+    async def sleep(self, seconds):
+        # cleared only after waking, so a replan() during a tick is not lost
+        try:
+            await asyncio.wait_for(self.wakeup.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+        self.wakeup.clear()
+
+    def stop(self):
+        self.stopping.set()
+        self.wakeup.set()
+
+    # --------------------------------------------------
+    # Control socket
+    # --------------------------------------------------
+    def control_status(self) -> dict:
+        return status_fields("daemon", self.last_snapshot, self.pipeline, self.scheduler, system.keyboard_queue)
+
+    def submit(self, fn, *args):
+        self.writes.submit(fn, *args)
+
+    def force_profile(self, profile):
+        self.submit(set_profile, profile, 0)
+
+    def replan(self):
+        self.wakeup.set()
+
+    def reload_config(self):
+        # an explicit reload also looks for sensors that appeared since
+        system.rescan_sensors()
+        self.reload()
+
+    # --------------------------------------------------
+    # Config reload
+    # --------------------------------------------------
+    def on_config_event(self):
+        if not self.config_watcher.read_events():
+            return
+        if self.config_check is not None:
+            self.config_check.cancel()
+        self.config_check = self.loop.call_later(ConfigWatcher.DEBOUNCE_MS / 1000, self.check_config)
+
+    def poll_config(self):
+        self.check_config()
+        if not self.stopping.is_set():
+            self.loop.call_later(ConfigWatcher.POLL_INTERVAL, self.poll_config)
+
+    def check_config(self):
+        self.config_check = None
+        if self.config_watcher.changed():
+            self.reload()
+
+    def reload(self):
+        self.apply_config_changes(reload_changed())
+
+    async def tick(self) -> float:
+        self.scheduler.record_wakeup()
+        try:
+            snapshot = await self.loop.run_in_executor(None, collect_snapshot)
+        except Exception as e:
+            event_log.error("daemon", "Failed to collect snapshot: %s", e)
+            return self.scheduler.min_interval
+        self.last_snapshot = snapshot
+
+        idle = snapshot.idle_seconds
+        pipeline = self.pipeline
+        action = pipeline.evaluate(idle, snapshot)
+        if action is not None:
+            self.submit(*action)
+        else:
+            # a transition writes the keyboard for the profile it applied,
+            # the snapshot still has the previous one
+            self.submit(apply_temperature_keyboard_rgb, snapshot)
+        self.export_metrics()
+
+        interval = pipeline.next_interval(self.scheduler, idle)
+        self.log_tick(snapshot, interval)
+        return interval
+
+
+def main() -> int:
+    pid = daemon_running()
+    if pid is not None:
+        print(f"auto-idle daemon already running (pid {pid})")
+        return 1
+
+    reload_settings()
+    rebuild_temperature_lut()
+    setup_sink(event_log)
+    return Daemon().run()
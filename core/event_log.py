@@ -0,0 +1,128 @@
+import logging
+import os
+import sys
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+LEVEL_NAMES = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+
+STATE_DIR = os.path.join(
+    os.environ.get("XDG_STATE_HOME", os.path.expanduser("~/.local/state")),
+    "auto-idle",
+)
+LOG_FILE = os.path.join(STATE_DIR, "events.log")
+
+
+class EventRecord:
+    __slots__ = ("timestamp", "level", "kind", "message", "args")
+
+    def __init__(self, timestamp, level, kind, message, args):
+        self.timestamp = timestamp
+        self.level = level
+        self.kind = kind
+        self.message = message
+        self.args = args
+
+    def text(self) -> str:
+        # formatting is deferred until somebody actually reads the record
+        if not self.args:
+            return self.message
+        try:
+            return self.message % self.args
+        except (TypeError, ValueError):
+            return f"{self.message} {self.args!r}"
+
+    def format(self) -> str:
+        ts = time.strftime("%H:%M:%S", time.localtime(self.timestamp))
+        return f"[{ts}] {logging.getLevelName(self.level):<7} {self.kind:<10} {self.text()}"
+
+
+class EventLog:
+    """
+    Fixed-size in-memory ring buffer of typed event records.
+
+    Records below `level` are dropped before anything is allocated.
+    Stored records keep their format arguments and are formatted only
+    when shown or written out. Only transitions and warnings/errors go
+    to the persistent sink, unless the log level is DEBUG.
+    """
+
+    def __init__(self, capacity=512, level=INFO):
+        self.capacity = capacity
+        self.level = level
+        self._records = [None] * capacity
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()  # probes and writes log from workers
+        self.sink = None
+
+    def enabled_for(self, level) -> bool:
+        return level >= self.level
+
+    def log(self, level, kind, message, *args):
+        if level < self.level:
+            return
+
+        record = EventRecord(time.time(), level, kind, message, args)
+        with self._lock:
+            self._records[self._next] = record
+            self._next = (self._next + 1) % self.capacity
+            if self._size < self.capacity:
+                self._size += 1
+
+        if self.sink and (kind == "transition" or level >= WARNING or self.level <= DEBUG):
+            self.sink.log(level, "%s", record.format())
+
+    def debug(self, kind, message, *args):
+        self.log(DEBUG, kind, message, *args)
+
+    def info(self, kind, message, *args):
+        self.log(INFO, kind, message, *args)
+
+    def warning(self, kind, message, *args):
+        self.log(WARNING, kind, message, *args)
+
+    def error(self, kind, message, *args):
+        self.log(ERROR, kind, message, *args)
+
+    def recent(self, count=None) -> list[EventRecord]:
+        """Oldest first, at most `count` of the newest records."""
+        with self._lock:
+            count = self._size if count is None else min(count, self._size)
+            start = (self._next - count) % self.capacity
+            return [self._records[(start + i) % self.capacity] for i in range(count)]
+
+
+def setup_sink(log: "EventLog", path=LOG_FILE, max_bytes=256 * 1024, backups=3):
+    """
+    Persist flushed records to a rotating file, or to stderr when running
+    under systemd (JOURNAL_STREAM is set) so they end up in the journal.
+    """
+    logger = logging.getLogger("auto-idle")
+    logger.setLevel(DEBUG)
+    logger.propagate = False
+
+    if os.environ.get("JOURNAL_STREAM"):
+        handler = logging.StreamHandler(sys.stderr)
+    else:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups)
+        except OSError as e:
+            print("Failed to open event log file:", e)
+            return
+
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    log.sink = logger
+
+
+event_log = EventLog(
+    level=LEVEL_NAMES.get(os.environ.get("AUTO_IDLE_LOG_LEVEL", "info").lower(), INFO)
+)
@@ -0,0 +1,127 @@
+from PyQt6.QtCore import QObject, QMetaType, pyqtSignal, pyqtSlot
+from PyQt6.QtDBus import QDBusArgument, QDBusConnection, QDBusMessage
+
+from core.event_log import event_log
+
+IDLE_MONITOR_SERVICE = "org.gnome.Mutter.IdleMonitor"
+IDLE_MONITOR_PATH = "/org/gnome/Mutter/IdleMonitor/Core"
+IDLE_MONITOR_INTERFACE = "org.gnome.Mutter.IdleMonitor"
+
+
+class IdleMonitor(QObject):
+    """
+    Persistent session bus client for Mutter's IdleMonitor.
+
+    The connection is opened once and reused for every call, so reading
+    the idle time is a single D-Bus round trip instead of a gdbus fork.
+
+    With watch() the monitor becomes event driven: an idle watch fires
+    when the threshold is crossed and a user-active watch fires on the
+    next input, each emitting idle_changed(True/False).
+    """
+
+    idle_changed = pyqtSignal(bool)
+
+    def __init__(self, bus: QDBusConnection | None = None):
+        super().__init__()
+        self._bus = bus if bus is not None else QDBusConnection.sessionBus()
+        self._signal_connected = False
+        self.idle_watch_id = None
+        self.active_watch_id = None
+        self.watch_ms = None
+
+    def is_available(self) -> bool:
+        return self._bus.isConnected()
+
+    def is_watching(self) -> bool:
+        return self.idle_watch_id is not None
+
+    def _call(self, method, *args):
+        msg = QDBusMessage.createMethodCall(
+            IDLE_MONITOR_SERVICE,
+            IDLE_MONITOR_PATH,
+            IDLE_MONITOR_INTERFACE,
+            method,
+        )
+        if args:
+            msg.setArguments(list(args))
+
+        reply = self._bus.call(msg)
+        if reply.type() != QDBusMessage.MessageType.ReplyMessage:
+            raise RuntimeError(f"{method} failed: {reply.errorMessage()}")
+        return reply.arguments()
+
+    def get_idle_ms(self) -> int:
+        return int(self._call("GetIdletime")[0])
+
+    # --------------------------------------------------
+    # Watches
+    # --------------------------------------------------
+    def watch(self, idle_ms: int) -> bool:
+        """
+        (Re-)arm the idle watch for idle_ms. Returns False if watches
+        are not supported, in which case the caller keeps polling.
+        """
+        if not self.is_available():
+            return False
+
+        try:
+            if not self._signal_connected:
+                self._signal_connected = self._bus.connect(
+                    IDLE_MONITOR_SERVICE,
+                    IDLE_MONITOR_PATH,
+                    IDLE_MONITOR_INTERFACE,
+                    "WatchFired",
+                    self._on_watch_fired,
+                )
+                if not self._signal_connected:
+                    return False
+
+            self.unwatch()
+            self.idle_watch_id = int(self._call(
+                "AddIdleWatch",
+                QDBusArgument(idle_ms, QMetaType.Type.ULongLong.value),
+            )[0])
+            self.watch_ms = idle_ms
+            return True
+        except Exception as e:
+            event_log.warning("idle", "Failed to add idle watch: %s", e)
+            self.idle_watch_id = None
+            return False
+
+    def watch_user_active(self):
+        if self.active_watch_id is not None:
+            return
+        try:
+            self.active_watch_id = int(self._call("AddUserActiveWatch")[0])
+        except Exception as e:
+            event_log.warning("idle", "Failed to add user active watch: %s", e)
+
+    def unwatch(self):
+        for watch_id in (self.idle_watch_id, self.active_watch_id):
+            if watch_id is None:
+                continue
+            try:
+                self._call(
+                    "RemoveWatch",
+                    QDBusArgument(watch_id, QMetaType.Type.UInt.value),
+                )
+            except Exception as e:
+                event_log.warning("idle", "Failed to remove idle watch: %s", e)
+
+        self.idle_watch_id = None
+        self.active_watch_id = None
+        self.watch_ms = None
+
+    @pyqtSlot(QDBusMessage)
+    def _on_watch_fired(self, msg: QDBusMessage):
+        watch_id = int(msg.arguments()[0])
+
+        if watch_id == self.idle_watch_id:
+            # user-active watches are one-shot, re-added on every idle period
+            self.watch_user_active()
+            self.idle_changed.emit(True)
+
+        elif watch_id == self.active_watch_id:
+            self.active_watch_id = None
+            self.idle_changed.emit(False)
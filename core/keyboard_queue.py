@@ -0,0 +1,104 @@
+import threading
+import time
+from collections import Counter
+
+from core.event_log import event_log
+
+# request sources, lowest priority first
+TEMPERATURE = "temperature"
+PROFILE = "profile"
+MANUAL = "manual"
+PRIORITY = {TEMPERATURE: 0, PROFILE: 1, MANUAL: 2}
+
+KEYBOARD_MIN_INTERVAL = 1.0
+
+
+class KeyboardQueue:
+    """
+    The one way to the keyboard. Requests go into a single pending slot
+    and the last one wins, except that a request never replaces a pending
+    one from a higher-priority source (manual > profile > temperature).
+    Writes are at least min_interval apart; a rate-limited request is
+    written by a timer once the interval has passed. A request matching
+    what was last written to the hardware is dropped.
+
+    counters[kind][source] count requested, written, identical (already
+    on the hardware), coalesced (replaced while pending) and preempted
+    (dropped for a pending higher-priority request).
+    """
+
+    def __init__(self, write, min_interval=KEYBOARD_MIN_INTERVAL, clock=time.monotonic):
+        self.write = write  # write(color, brightness)
+        self.min_interval = min_interval
+        self.clock = clock
+
+        self.pending = None  # (source, color, brightness)
+        self.current = None  # (color, brightness) on the hardware, None if unknown
+        self.last_write = None
+        self.timer = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+        self.counters = {
+            kind: Counter()
+            for kind in ("requested", "written", "identical", "coalesced", "preempted")
+        }
+
+    def request(self, source, color, brightness):
+        counters = self.counters
+        with self._lock:
+            counters["requested"][source] += 1
+            pending = self.pending
+            if pending is not None:
+                if PRIORITY[source] < PRIORITY[pending[0]]:
+                    counters["preempted"][source] += 1
+                    return
+                counters["coalesced"][pending[0]] += 1
+            self.pending = (source, color.lower(), brightness)
+        self.flush()
+
+    def invalidate(self):
+        """Forget the hardware state, so the next request is written (after a resume)."""
+        with self._lock:
+            self.current = None
+
+    def flush(self):
+        with self._write_lock:
+            with self._lock:
+                request = self.pending
+                if request is None:
+                    return
+                source, color, brightness = request
+                if (color, brightness) == self.current:
+                    self.pending = None
+                    self.counters["identical"][source] += 1
+                    return
+
+                now = self.clock()
+                if self.last_write is not None and now - self.last_write < self.min_interval:
+                    if self.timer is None:
+                        self.timer = threading.Timer(self.last_write + self.min_interval - now, self._on_timer)
+                        self.timer.daemon = True
+                        self.timer.start()
+                    return
+                self.pending = None
+                self.last_write = now
+
+            try:
+                self.write(color, brightness)
+            except Exception as e:
+                self.current = None
+                event_log.error("keyboard", "Failed to set keyboard RGB (%s): %s", source, e)
+                return
+
+            self.current = (color, brightness)
+            self.counters["written"][source] += 1
+            event_log.info("keyboard", "Keyboard set by %s: %s, brightness=%s", source, color.upper(), brightness)
+
+    def _on_timer(self):
+        with self._lock:
+            self.timer = None
+        self.flush()
+
+    def stats(self) -> dict:
+        return {kind: dict(counter) for kind, counter in self.counters.items()}
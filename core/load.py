@@ -0,0 +1,88 @@
+import time
+
+from core.thermal import PROFILE_ORDER
+
+
+class LoadGovernor:
+    """
+    Moves the active profile one step up while the CPU is busy and one
+    step down while it is nearly idle.
+
+    Each sample maps to a target offset: +1 when utilisation reaches
+    boost_above percent or CPU pressure (PSI "some") reaches
+    pressure_above percent, -1 when utilisation is at or below
+    relax_below percent without pressure, 0 otherwise. The thresholds
+    move HYSTERESIS points in favour of the current offset. A target
+    is adopted once it has held for boost_seconds (going up) or
+    relax_seconds (going down), so short spikes and pauses between
+    builds change nothing.
+
+    Priority: only the active profile is adjusted, idle tiers are not;
+    the thermal cap still applies on top (ThermalGovernor.clamp()).
+    """
+
+    HYSTERESIS = 10
+
+    def __init__(self, boost_above=75, relax_below=15, pressure_above=20,
+                 boost_seconds=10, relax_seconds=60, clock=time.monotonic):
+        self.boost_above = boost_above
+        self.relax_below = relax_below
+        self.pressure_above = pressure_above
+        self.boost_seconds = boost_seconds
+        self.relax_seconds = relax_seconds
+        self.clock = clock
+
+        self.offset = 0  # profile steps applied to the active profile
+        self.target = 0
+        self.since = None
+
+    def configure(self, boost_above, relax_below, pressure_above, boost_seconds, relax_seconds):
+        self.boost_above = boost_above
+        self.relax_below = relax_below
+        self.pressure_above = pressure_above
+        self.boost_seconds = boost_seconds
+        self.relax_seconds = relax_seconds
+
+    def reset(self):
+        self.offset = 0
+        self.target = 0
+        self.since = None
+
+    def _target(self, utilisation, pressure) -> int:
+        band = self.HYSTERESIS
+        boost_above = self.boost_above - (band if self.offset > 0 else 0)
+        pressure_above = self.pressure_above - (band if self.offset > 0 else 0)
+        relax_below = self.relax_below + (band if self.offset < 0 else 0)
+
+        stalled = pressure is not None and pressure >= pressure_above
+        if utilisation >= boost_above or stalled:
+            return 1
+        if utilisation <= relax_below and not stalled:
+            return -1
+        return 0
+
+    def update(self, utilisation, pressure=None) -> bool:
+        """Feed one sample (percent). Returns True when the offset changed."""
+        if utilisation is None:
+            return False
+
+        now = self.clock()
+        target = self._target(utilisation, pressure)
+        if target != self.target or self.since is None:
+            self.target = target
+            self.since = now
+        if target == self.offset:
+            return False
+
+        hold = self.boost_seconds if target > self.offset else self.relax_seconds
+        if now - self.since < hold:
+            return False
+
+        self.offset = target
+        return True
+
+    def adjust(self, profile: str) -> str:
+        if not self.offset or profile not in PROFILE_ORDER:
+            return profile
+        i = PROFILE_ORDER.index(profile) + self.offset
+        return PROFILE_ORDER[max(0, min(i, len(PROFILE_ORDER) - 1))]
@@ -0,0 +1,131 @@
+import json
+import os
+import time
+from functools import wraps
+
+# bucket i counts calls that took < 2**(i + 10) ns (~2**i µs); the last one is +Inf
+BUCKETS = 24
+
+
+class ProbeStats:
+    __slots__ = ("name", "calls", "errors", "total_ns", "buckets")
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.buckets = [0] * (BUCKETS + 1)
+
+    def record(self, elapsed_ns):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        # log2 bucketing on 1024 ns units, no float math in the hot path
+        idx = (elapsed_ns >> 10).bit_length()
+        self.buckets[idx if idx < BUCKETS else BUCKETS] += 1
+
+    def as_dict(self) -> dict:
+        upper = {f"{2 ** (i + 10)}ns": n for i, n in enumerate(self.buckets[:BUCKETS]) if n}
+        if self.buckets[BUCKETS]:
+            upper["inf"] = self.buckets[BUCKETS]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": round(self.total_ns / 1e6, 3),
+            "mean_us": round(self.total_ns / self.calls / 1e3, 1) if self.calls else 0,
+            "histogram": upper,
+        }
+
+
+class Metrics:
+    """
+    Call counts, error counts and log-bucketed latency histograms per
+    probe. Counters are plain ints updated without locking: an update
+    racing between worker threads may be lost, which is acceptable for
+    diagnostics and keeps the overhead well under a microsecond.
+    """
+
+    def __init__(self):
+        self.probes: dict[str, ProbeStats] = {}
+
+    def probe(self, name) -> ProbeStats:
+        stats = self.probes.get(name)
+        if stats is None:
+            stats = self.probes[name] = ProbeStats(name)
+        return stats
+
+    def timed(self, name):
+        """Decorator recording latency of every call and raised exceptions."""
+        stats = self.probe(name)
+        clock = time.perf_counter_ns
+
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                start = clock()
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException:
+                    stats.errors += 1
+                    stats.record(clock() - start)
+                    raise
+                # ProbeStats.record() inlined, this is the hot path
+                elapsed = clock() - start
+                stats.calls += 1
+                stats.total_ns += elapsed
+                idx = (elapsed >> 10).bit_length()
+                stats.buckets[idx if idx < BUCKETS else BUCKETS] += 1
+                return result
+            return wrapper
+
+        return decorator
+
+    def record_error(self, name):
+        """For probes that handle their own failures and return a fallback."""
+        self.probe(name).errors += 1
+
+    # --------------------------------------------------
+    # Export
+    # --------------------------------------------------
+    def to_json(self) -> str:
+        return json.dumps(
+            {name: stats.as_dict() for name, stats in sorted(self.probes.items())},
+            indent=2,
+        )
+
+    def to_prometheus(self) -> str:
+        lines = [
+            "# HELP auto_idle_probe_duration_seconds Latency of system probes.",
+            "# TYPE auto_idle_probe_duration_seconds histogram",
+        ]
+        for name, stats in sorted(self.probes.items()):
+            cumulative = 0
+            for i in range(BUCKETS):
+                cumulative += stats.buckets[i]
+                lines.append(
+                    f'auto_idle_probe_duration_seconds_bucket{{probe="{name}",le="{2 ** (i + 10) / 1e9:g}"}} {cumulative}'
+                )
+            lines.append(f'auto_idle_probe_duration_seconds_bucket{{probe="{name}",le="+Inf"}} {stats.calls}')
+            lines.append(f'auto_idle_probe_duration_seconds_sum{{probe="{name}"}} {stats.total_ns / 1e9:.9f}')
+            lines.append(f'auto_idle_probe_duration_seconds_count{{probe="{name}"}} {stats.calls}')
+
+        lines += [
+            "# HELP auto_idle_probe_errors_total Failed probe calls.",
+            "# TYPE auto_idle_probe_errors_total counter",
+        ]
+        for name, stats in sorted(self.probes.items()):
+            lines.append(f'auto_idle_probe_errors_total{{probe="{name}"}} {stats.errors}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """
+        Write the node_exporter textfile atomically; the collector must
+        never see a half-written file.
+        """
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp, path)
+
+
+metrics = Metrics()
@@ -0,0 +1,66 @@
+import time
+
+from config.config import METRICS_EXPORT_INTERVAL, METRICS_FILE
+from core.event_log import DEBUG, event_log
+from core.metrics import metrics
+from core.system import rebuild_temperature_lut
+import core.system as system
+
+
+class PipelineOwner:
+    """
+    What TrayApp and the daemon share around their ProfilePipeline:
+    applying reloaded settings, the periodic metrics export and the
+    debug line of each tick.
+
+    Owners provide pipeline, scheduler, submit(fn, *args) (their write
+    thread) and replan() (tick again now, also used by core.control).
+    """
+
+    last_spawn_count = 0
+    last_metrics_export = 0.0
+
+    def apply_config_changes(self, changed):
+        """
+        Rebuild only the state derived from the changed settings. Our own
+        saves come back here too and change nothing.
+        """
+        if not changed:
+            return
+        if "temperature_rgb" in changed:
+            rebuild_temperature_lut()
+        self.pipeline.configure(changed)
+        event_log.info("settings", "Settings reloaded: %s", ", ".join(sorted(changed)))
+        # the threshold may have moved closer, re-plan the next wakeup now
+        self.replan()
+
+    def export_metrics(self):
+        now = time.monotonic()
+        if not METRICS_FILE or now - self.last_metrics_export < METRICS_EXPORT_INTERVAL:
+            return
+        self.last_metrics_export = now
+        self.submit(metrics.write_prometheus, METRICS_FILE)
+
+    def tick_details(self, snapshot) -> dict:
+        """Owner specific fields for the tick line."""
+        return {}
+
+    def log_tick(self, snapshot, interval):
+        spawns = system.subprocess_calls - self.last_spawn_count
+        self.last_spawn_count = system.subprocess_calls
+        if not event_log.enabled_for(DEBUG):
+            return
+
+        pipeline = self.pipeline
+        policy = pipeline.policy
+        details = "".join(f" {name}={value}" for name, value in self.tick_details(snapshot).items())
+        event_log.debug(
+            "tick",
+            "idle=%ss limit=%ss state=%s tier=%s transitions=%s suppressed=%s "
+            "CPU(t)=%s cap=%s load=%s boost=%+d%s spawns=%s next=%.0fs wakeups/h=%.0f",
+            snapshot.idle_seconds, pipeline.tiers.limit, policy.state, pipeline.tiers.index,
+            dict(policy.transitions), policy.suppressed,
+            snapshot.cpu_temp, pipeline.thermal.capped_profile,
+            None if snapshot.cpu_load is None else round(snapshot.cpu_load), pipeline.load.offset,
+            details, spawns, interval, self.scheduler.wakeups_per_hour,
+        )
@@ -0,0 +1,189 @@
+from config.config import settings
+from core.control import ControlState
+from core.event_log import event_log
+from core.load import LoadGovernor
+from core.policy import POLICY_FIELDS, IdlePolicy
+from core.system import apply_active, apply_idle_tier
+from core.thermal import ThermalGovernor
+from core.tiers import TIER_FIELDS, IdleTiers, tiers_from_settings
+
+# Settings fields that change what action() writes
+ACTION_FIELDS = TIER_FIELDS | {"active_mode", "keyboard", "temperature_rgb"}
+
+
+def _thermal_args():
+    thermal = settings.thermal
+    return (
+        thermal.get("limit_c", 85),
+        thermal.get("headroom_c", 10),
+        thermal.get("horizon_seconds", 30),
+        thermal.get("dwell_seconds", 30),
+    )
+
+
+def _load_args():
+    load = settings.load
+    return (
+        load.get("boost_above", 75),
+        load.get("relax_below", 15),
+        load.get("pressure_above", 20),
+        load.get("boost_seconds", 10),
+        load.get("relax_seconds", 60),
+    )
+
+
+class ProfilePipeline:
+    """
+    Decides which profile applies, shared by TrayApp and the daemon so
+    both run the same stages. In priority order:
+
+      1. control  a pause or forced profile from `auto-idle ctl`; nothing
+                  is switched automatically while it lasts
+      2. thermal  ThermalGovernor caps the profile while the CPU runs hot
+      3. idle     IdlePolicy (active vs idle) and IdleTiers (how deep)
+      4. apps     settings.app_rules replace active_mode while a matching
+                  process runs (core.procscan)
+      5. load     LoadGovernor moves the active profile a step up or
+                  down with sustained CPU load; idle tiers are left as is
+
+    evaluate() returns the write the owner must run on its write thread.
+    """
+
+    def __init__(self):
+        self.policy = IdlePolicy(
+            hysteresis_seconds=settings.hysteresis_seconds,
+            min_dwell_seconds=settings.min_dwell_seconds,
+            grace_seconds=settings.grace_seconds,
+        )
+        self.tiers = IdleTiers(tiers_from_settings(settings))
+        self.thermal = ThermalGovernor(*_thermal_args())
+        self.load = LoadGovernor(*_load_args())
+        self.control = ControlState()
+        # from the last snapshot, see ProcessScanner
+        self.app_profile = None
+        # re-apply on the next evaluate(), e.g. after the thermal cap was dropped
+        self.pending = False
+
+    def configure(self, changed=None):
+        """
+        Re-read settings: all of them, or only the changed field names.
+        A change to what action() writes is applied on the next evaluate().
+        """
+        if changed is None or changed & ACTION_FIELDS:
+            self.pending = True
+        if changed is None or changed & TIER_FIELDS:
+            self.tiers.configure(tiers_from_settings(settings))
+        if changed is None or changed & POLICY_FIELDS:
+            self.policy.configure(
+                settings.hysteresis_seconds,
+                settings.min_dwell_seconds,
+                settings.grace_seconds,
+            )
+        if changed is None or "thermal" in changed:
+            self.thermal.configure(*_thermal_args())
+            if not self.thermal_enabled and self.thermal.cap is not None:
+                self.thermal.reset()
+                self.pending = True
+        if changed is None or "load" in changed:
+            self.load.configure(*_load_args())
+            if not self.load_enabled and self.load.offset:
+                self.load.reset()
+                self.pending = True
+
+    @property
+    def thermal_enabled(self) -> bool:
+        return bool(settings.thermal.get("enabled"))
+
+    @property
+    def load_enabled(self) -> bool:
+        return bool(settings.load.get("enabled"))
+
+    @property
+    def sampling(self) -> bool:
+        """A stage needs regular samples rather than event driven ticks."""
+        return (
+            self.policy.settling
+            or self.thermal_enabled
+            or ((self.load_enabled or bool(settings.app_rules)) and not self.policy.is_idle)
+            or bool(settings.temperature_rgb.get("enabled"))
+        )
+
+    def active_profile(self) -> str:
+        """The profile while the user is active, before the thermal cap."""
+        return self.load.adjust(self.app_profile or settings.active_mode)
+
+    def wanted_profile(self) -> str:
+        """What the idle, app and load stages would apply, before the thermal cap."""
+        tier = self.tiers.current if self.policy.is_idle else None
+        return tier["profile"] if tier else self.active_profile()
+
+    def action(self, idle):
+        tier = self.tiers.current if self.policy.is_idle else None
+        clamp = self.thermal.clamp
+        if tier is not None:
+            return apply_idle_tier, dict(tier, profile=clamp(tier["profile"])), idle
+        return apply_active, clamp(self.active_profile()), idle
+
+    def evaluate(self, idle, snapshot=None):
+        """
+        Feed one sample: the idle time, and the tick's SystemSnapshot for
+        the sampled stages (None on an idle watch event). Returns
+        (fn, *args) to apply, or None when the applied profile stays as
+        it is.
+        """
+        policy = self.policy
+        transition = policy.update(idle, self.tiers.limit)
+        tier = self.tiers.update(idle, policy.is_idle)
+
+        cpu_temp = cpu_load = cpu_pressure = None
+        apps_changed = False
+        if snapshot is not None:
+            cpu_temp, cpu_load, cpu_pressure = snapshot.cpu_temp, snapshot.cpu_load, snapshot.cpu_pressure
+            if snapshot.app_profile != self.app_profile:
+                self.app_profile = snapshot.app_profile
+                # idle tiers apply regardless, picked up on return to active
+                apps_changed = not policy.is_idle
+
+        loaded = False
+        if policy.is_idle:
+            # back to the plain active profile when the user returns
+            self.load.reset()
+        elif cpu_load is not None and self.load_enabled:
+            loaded = self.load.update(cpu_load, cpu_pressure)
+            if loaded:
+                event_log.info(
+                    "load", "CPU %.0f%% busy, pressure %s: active profile %s",
+                    cpu_load, "n/a" if cpu_pressure is None else f"{cpu_pressure:.0f}%",
+                    self.active_profile(),
+                )
+
+        throttled = False
+        if cpu_temp is not None and self.thermal_enabled:
+            throttled = self.thermal.update(cpu_temp, self.wanted_profile())
+            if throttled:
+                thermal = self.thermal
+                event_log.info(
+                    "thermal", "CPU %.0f°C, trend %+.2f°C/s: profile capped at %s",
+                    thermal.smoothed, thermal.slope, thermal.capped_profile or "none",
+                )
+
+        resumed = self.control.resumed()
+        if self.control.paused:
+            return None
+        if resumed or self.pending or transition is not None or tier is not None or throttled or loaded or apps_changed:
+            self.pending = False
+            return self.action(idle)
+        return None
+
+    def next_interval(self, scheduler, idle, watching=False) -> float:
+        interval = scheduler.next_interval(
+            idle,
+            self.tiers.limit,
+            self.policy.is_idle,
+            watching=watching,
+            sampling=self.sampling,
+            next_boundary=self.tiers.next_boundary,
+        )
+        if self.control.paused:
+            interval = min(interval, self.control.remaining)
+        return interval
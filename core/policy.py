@@ -0,0 +1,110 @@
+import time
+
+ACTIVE = "active"
+IDLE = "idle"
+
+# Settings fields passed to IdlePolicy.configure()
+POLICY_FIELDS = {"hysteresis_seconds", "min_dwell_seconds", "grace_seconds"}
+
+
+class IdlePolicy:
+    """
+    Active/idle state machine behind the profile switching.
+
+    - idle after idle >= limit seconds
+    - back to active only once activity is sustained: input must still
+      be coming in grace_seconds after the first sign of the user, and a
+      pending return is dropped if idle time grows past
+      hysteresis_seconds again (a single mouse nudge)
+    - a state is held for at least min_dwell_seconds before switching
+
+    update() returns the new state when a transition happens, so the
+    caller only touches the system on real transitions.
+    """
+
+    def __init__(self, hysteresis_seconds=30, min_dwell_seconds=30, grace_seconds=5,
+                 clock=time.monotonic):
+        self.hysteresis_seconds = hysteresis_seconds
+        self.min_dwell_seconds = min_dwell_seconds
+        self.grace_seconds = grace_seconds
+        self.clock = clock
+
+        self.state = ACTIVE
+        self.entered_at = clock()
+        self.active_since = None  # first activity seen while idle
+        self.held_back = False  # idle crossing waiting for min dwell
+
+        self.transitions = {IDLE: 0, ACTIVE: 0}
+        self.suppressed = 0  # samples where a crossing was held back
+
+    @property
+    def is_idle(self) -> bool:
+        return self.state == IDLE
+
+    @property
+    def settling(self) -> bool:
+        """A transition is pending and needs another sample to decide."""
+        return self.active_since is not None or self.held_back
+
+    def configure(self, hysteresis_seconds, min_dwell_seconds, grace_seconds):
+        self.hysteresis_seconds = hysteresis_seconds
+        self.min_dwell_seconds = min_dwell_seconds
+        self.grace_seconds = grace_seconds
+
+    def _dwell_ok(self, now):
+        return now - self.entered_at >= self.min_dwell_seconds
+
+    def _enter(self, state, now):
+        self.state = state
+        self.entered_at = now
+        self.active_since = None
+        self.held_back = False
+        self.transitions[state] += 1
+        return state
+
+    def update(self, idle, limit) -> str | None:
+        now = self.clock()
+
+        if self.state == ACTIVE:
+            self.held_back = False
+            if idle < limit:
+                return None
+            if not self._dwell_ok(now):
+                self.held_back = True
+                self.suppressed += 1
+                return None
+            return self._enter(IDLE, now)
+
+        # IDLE
+        if idle >= limit:
+            self.active_since = None
+            return None
+
+        if self.active_since is None:
+            # first input after being idle: wait for it to be sustained
+            self.active_since = now - idle
+            if self.grace_seconds <= 0 and self._dwell_ok(now):
+                return self._enter(ACTIVE, now)
+            return None
+
+        if idle > self.hysteresis_seconds:
+            # user touched the mouse once and left again
+            self.active_since = None
+            self.suppressed += 1
+            return None
+
+        elapsed = now - self.active_since
+        if elapsed < self.grace_seconds or idle >= elapsed:
+            # grace window still open, or no input since the first one
+            return None
+        if not self._dwell_ok(now):
+            self.suppressed += 1
+            return None
+
+        return self._enter(ACTIVE, now)
+
+    def reset(self):
+        self.state = ACTIVE
+        self.entered_at = self.clock()
+        self.active_since = None
+        self.held_back = False
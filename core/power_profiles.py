@@ -0,0 +1,103 @@
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from PyQt6.QtDBus import QDBusConnection, QDBusMessage, QDBusVariant
+
+PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+
+# newer power-profiles-daemon releases export both names, older only net.hadess
+POWER_PROFILES_SERVICES = (
+    (
+        "org.freedesktop.UPower.PowerProfiles",
+        "/org/freedesktop/UPower/PowerProfiles",
+        "org.freedesktop.UPower.PowerProfiles",
+    ),
+    (
+        "net.hadess.PowerProfiles",
+        "/net/hadess/PowerProfiles",
+        "net.hadess.PowerProfiles",
+    ),
+)
+
+
+def _unwrap(value):
+    if isinstance(value, QDBusVariant):
+        return value.variant()
+    return value
+
+
+class PowerProfiles(QObject):
+    """
+    System bus client for power-profiles-daemon.
+
+    ActiveProfile is read once on connect and then kept up to date from
+    PropertiesChanged, so active_profile is a plain attribute read.
+    """
+
+    profile_changed = pyqtSignal(str)
+
+    def __init__(self, bus: QDBusConnection | None = None):
+        super().__init__()
+        self._bus = bus if bus is not None else QDBusConnection.systemBus()
+        self._service = None
+        self.active_profile = None
+        self._connect()
+
+    def is_available(self) -> bool:
+        return self._service is not None
+
+    def _properties_call(self, service, path, method, args):
+        msg = QDBusMessage.createMethodCall(service, path, PROPERTIES_INTERFACE, method)
+        msg.setArguments(args)
+
+        reply = self._bus.call(msg)
+        if reply.type() != QDBusMessage.MessageType.ReplyMessage:
+            raise RuntimeError(f"{method} failed: {reply.errorMessage()}")
+        return reply.arguments()
+
+    def _connect(self):
+        if not self._bus.isConnected():
+            return
+
+        for service, path, interface in POWER_PROFILES_SERVICES:
+            try:
+                value = self._properties_call(
+                    service, path, "Get", [interface, "ActiveProfile"]
+                )[0]
+            except Exception:
+                continue
+
+            self._service = (service, path, interface)
+            self.active_profile = str(_unwrap(value))
+            self._bus.connect(
+                service,
+                path,
+                PROPERTIES_INTERFACE,
+                "PropertiesChanged",
+                self._on_properties_changed,
+            )
+            return
+
+    def set_active_profile(self, profile: str):
+        if not self._service:
+            raise RuntimeError("power-profiles-daemon is not available")
+
+        service, path, interface = self._service
+        self._properties_call(
+            service, path, "Set",
+            [interface, "ActiveProfile", QDBusVariant(profile)],
+        )
+        self._update(profile)
+
+    def _update(self, profile):
+        if profile == self.active_profile:
+            return
+        self.active_profile = profile
+        self.profile_changed.emit(profile)
+
+    @pyqtSlot(QDBusMessage)
+    def _on_properties_changed(self, msg: QDBusMessage):
+        interface, changed = msg.arguments()[:2]
+        if interface != self._service[2]:
+            return
+
+        if "ActiveProfile" in changed:
+            self._update(str(_unwrap(changed["ActiveProfile"])))
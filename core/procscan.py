@@ -0,0 +1,157 @@
+import os
+import re
+from fnmatch import translate
+
+from core.event_log import event_log
+from core.thermal import PROFILE_ORDER
+
+# /proc/<pid>/comm is the executable name cut to TASK_COMM_LEN - 1
+COMM_LEN = 15
+
+
+def compile_rules(rules: list[dict]) -> list[tuple[frozenset, re.Pattern | None, str]]:
+    """
+    settings.app_rules as (names, pattern, profile). A rule looks like
+    {"apps": ["cargo", "gcc", "*.exe"], "profile": "performance"}; plain
+    names match the comm or exe name exactly, names with wildcards are
+    fnmatch patterns. Rules that are not objects, have an unknown profile
+    or no list of apps are skipped, as are app names that are not strings.
+    """
+    compiled = []
+    for rule in rules:
+        if not isinstance(rule, dict):
+            event_log.warning("apps", "Ignoring app rule %r", rule)
+            continue
+        profile = rule.get("profile")
+        apps = rule.get("apps")
+        if profile not in PROFILE_ORDER or not isinstance(apps, list) or not apps:
+            event_log.warning("apps", "Ignoring app rule %s", rule)
+            continue
+        names = set()
+        patterns = []
+        for app in apps:
+            if not isinstance(app, str) or not app:
+                event_log.warning("apps", "Ignoring app name %r in rule %s", app, rule)
+                continue
+            if any(c in app for c in "*?["):
+                patterns.append(translate(app))
+            else:
+                names.update((app, app[:COMM_LEN]))
+        pattern = re.compile("|".join(patterns)) if patterns else None
+        compiled.append((frozenset(names), pattern, profile))
+    return compiled
+
+
+class ProcessScanner:
+    """
+    Which app rule has a running process, from an incremental /proc scan.
+
+    The PID list is one listdir(), compared as strings against the
+    cache with set operations only; PIDs not seen before are
+    identified (/proc/<pid>/comm and the exe link), PIDs that are gone are
+    dropped, and everything else comes from the cache. A new PID is
+    identified once more on the following scan, since a shell's child
+    carries the shell's name until it has exec'd. Each cached process
+    keeps the index of the first rule it matches and a count per rule is
+    kept up to date, so the winner is the first rule with a count.
+
+    The netlink proc connector would avoid the listdir() but needs
+    CAP_NET_ADMIN; polling stays well under a millisecond per tick.
+    """
+
+    def __init__(self, procfs_root="/proc"):
+        self.procfs_root = procfs_root
+        self.rules = []
+        self.source = None  # the settings.app_rules list self.rules came from
+        self.processes: dict[str, tuple[str, str | None, int | None]] = {}  # pid -> (comm, exe, rule)
+        self.counts: list[int] = []
+        self.fresh: set[str] = set()
+        # /proc entries that are not processes ("self", "stat", ...)
+        self.ignored: set[str] = set()
+        self.profile = None
+        self.matched = None  # the process name that decided self.profile
+
+    def configure(self, rules: list[dict]):
+        self.source = rules
+        self.rules = compile_rules(rules)
+        self.counts = [0] * len(self.rules)
+        for pid, (comm, exe, _) in self.processes.items():
+            rule = self._match(comm, exe)
+            self.processes[pid] = (comm, exe, rule)
+            if rule is not None:
+                self.counts[rule] += 1
+
+    def clear(self):
+        self.processes.clear()
+        self.fresh.clear()
+        self.ignored.clear()
+        self.counts = [0] * len(self.rules)
+        self.profile = self.matched = None
+
+    def _match(self, comm, exe) -> int | None:
+        for i, (names, pattern, _) in enumerate(self.rules):
+            if comm in names or exe in names:
+                return i
+            if pattern is not None and (pattern.match(comm) or (exe and pattern.match(exe))):
+                return i
+        return None
+
+    def _identify(self, pid) -> tuple[str, str | None] | None:
+        base = f"{self.procfs_root}/{pid}"
+        try:
+            with open(f"{base}/comm", "rb") as f:
+                comm = f.read().rstrip(b"\n").decode(errors="replace")
+        except OSError:
+            # exited since the listdir()
+            return None
+        try:
+            # other users' processes and kernel threads have no readable link
+            exe = os.path.basename(os.readlink(f"{base}/exe")).removesuffix(" (deleted)")
+        except OSError:
+            exe = None
+        return comm, exe
+
+    def _add(self, pid):
+        found = self._identify(pid)
+        if found is None:
+            return
+        rule = self._match(*found)
+        self.processes[pid] = (*found, rule)
+        if rule is not None:
+            self.counts[rule] += 1
+
+    def _drop(self, pid):
+        rule = self.processes.pop(pid)[2]
+        if rule is not None:
+            self.counts[rule] -= 1
+
+    def scan(self) -> str | None:
+        """Profile of the first rule with a running process, or None."""
+        try:
+            entries = set(os.listdir(self.procfs_root))
+        except OSError as e:
+            event_log.warning("apps", "Failed to list processes: %s", e)
+            return self.profile
+
+        processes = self.processes
+        for pid in processes.keys() - entries:
+            self._drop(pid)
+        for pid in self.fresh & entries:
+            if pid in processes:
+                self._drop(pid)
+            self._add(pid)
+        new = entries.difference(processes.keys(), self.ignored)
+        for entry in new:
+            if entry.isdigit():
+                self._add(entry)
+            else:
+                self.ignored.add(entry)
+        self.fresh = new - self.ignored
+
+        winner = next((i for i, count in enumerate(self.counts) if count), None)
+        profile = self.rules[winner][2] if winner is not None else None
+        if profile != self.profile:
+            self.matched = None if winner is None else next(p[0] for p in processes.values() if p[2] == winner)
+            event_log.info("apps", "App rule: %s (%s)", profile or "none", self.matched or "no match")
+            self.profile = profile
+        return profile
@@ -0,0 +1,140 @@
+import os
+import time
+from array import array
+
+from core.event_log import event_log
+
+# the aggregate "cpu" line is well within this, /proc/stat is read from
+# offset 0 and everything past the first line is ignored
+STAT_READ_SIZE = 256
+PRESSURE_READ_SIZE = 128
+
+# wait before trying to open /proc/stat again after a failure
+OPEN_RETRY_NS = 30 * 1_000_000_000
+
+# slots of CpuLoadSampler.prev / .delta
+TOTAL, IDLE, STALL, WALL = range(4)
+
+
+class CpuLoadSampler:
+    """
+    CPU utilisation from /proc/stat and, when the kernel has PSI, the
+    share of time runnable tasks waited for a CPU from /proc/pressure/cpu.
+
+    Both files stay open and are read with os.preadv into buffers
+    allocated once. The previous counters live in an array('q') that
+    each sample overwrites in place with the new values, after taking
+    the deltas into a second array; only the integer parsing of the
+    "cpu" line allocates. The first sample only primes the counters.
+    If /proc/stat cannot be opened or read, sampling retries every 30
+    seconds.
+    """
+
+    def __init__(self, procfs_root="/proc", clock=time.monotonic_ns):
+        self.procfs_root = procfs_root
+        self.clock = clock
+        self.stat_buf = bytearray(STAT_READ_SIZE)
+        self.pressure_buf = bytearray(PRESSURE_READ_SIZE)
+        self.prev = array("q", bytes(8 * 4))
+        self.delta = array("q", bytes(8 * 4))
+        self.primed = False
+        self._stat_fd = None
+        self._pressure_fd = None
+        self.opened = False
+        self.retry_at = 0
+
+        self.utilisation = None  # percent of CPU time busy since the last sample
+        self.pressure = None  # percent of wall time some task waited for a CPU
+
+    def open(self) -> bool:
+        self.close()
+        try:
+            self._stat_fd = os.open(os.path.join(self.procfs_root, "stat"), os.O_RDONLY | os.O_CLOEXEC)
+        except OSError as e:
+            event_log.warning("load", "Failed to open /proc/stat: %s", e)
+            self.retry_at = self.clock() + OPEN_RETRY_NS
+            return False
+        self.opened = True
+        try:
+            self._pressure_fd = os.open(
+                os.path.join(self.procfs_root, "pressure", "cpu"), os.O_RDONLY | os.O_CLOEXEC
+            )
+        except OSError:
+            # kernel without CONFIG_PSI, utilisation alone decides
+            self._pressure_fd = None
+        return True
+
+    def close(self):
+        for fd in (self._stat_fd, self._pressure_fd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._stat_fd = None
+        self._pressure_fd = None
+        self.opened = False
+        self.primed = False
+
+    def _read_stall(self) -> int | None:
+        """Cumulative "some" stall time in microseconds."""
+        buf = self.pressure_buf
+        try:
+            n = os.preadv(self._pressure_fd, [buf], 0)
+        except OSError:
+            return None
+        start = buf.find(b"total=", 0, n)
+        if start < 0:
+            return None
+        end = buf.find(b"\n", start, n)
+        return int(buf[start + 6:end if end >= 0 else n])
+
+    def sample(self) -> float | None:
+        """Read the counters once; returns utilisation in percent."""
+        if not self.opened and (self.clock() < self.retry_at or not self.open()):
+            return None
+
+        buf = self.stat_buf
+        try:
+            n = os.preadv(self._stat_fd, [buf], 0)
+            # "cpu  user nice system idle iowait irq softirq steal guest guest_nice"
+            end = buf.find(b"\n", 0, n)
+            # no newline: the whole read is the line
+            fields = buf[:end if end >= 0 else n].split()
+            idle = int(fields[4]) + int(fields[5])
+            total = idle + int(fields[1]) + int(fields[2]) + int(fields[3]) \
+                + int(fields[6]) + int(fields[7]) + int(fields[8])
+        except (OSError, ValueError, IndexError) as e:
+            event_log.warning("load", "Failed to read /proc/stat: %s", e)
+            self.close()
+            self.retry_at = self.clock() + OPEN_RETRY_NS
+            self.utilisation = self.pressure = None
+            return None
+
+        stall = self._read_stall() if self._pressure_fd is not None else None
+        now = self.clock()
+
+        prev, delta = self.prev, self.delta
+        delta[TOTAL] = total - prev[TOTAL]
+        delta[IDLE] = idle - prev[IDLE]
+        delta[WALL] = now - prev[WALL]
+        prev[TOTAL] = total
+        prev[IDLE] = idle
+        prev[WALL] = now
+        if stall is not None:
+            delta[STALL] = stall - prev[STALL]
+            prev[STALL] = stall
+
+        if not self.primed:
+            self.primed = True
+            self.utilisation = self.pressure = None
+            return None
+
+        if delta[TOTAL] > 0:
+            self.utilisation = 100.0 * (delta[TOTAL] - delta[IDLE]) / delta[TOTAL]
+        if stall is not None and delta[WALL] > 0:
+            # stall is in microseconds, the clock in nanoseconds
+            self.pressure = min(100.0, 100_000.0 * delta[STALL] / delta[WALL])
+        else:
+            self.pressure = None
+        return self.utilisation
@@ -0,0 +1,56 @@
+import time
+
+
+class AdaptiveScheduler:
+    """
+    Decides when the next tick should run.
+
+    While the user is active the idle threshold cannot be crossed before
+    limit - idle seconds have passed, so there is no reason to wake up
+    earlier than that. Close to the threshold, while idle (the user may
+    come back at any moment) and while something needs regular samples
+    (temperature RGB) the scheduler falls back to min_interval.
+    """
+
+    def __init__(self, min_interval=5, max_interval=300):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.started = time.monotonic()
+        self.wakeups = 0
+
+    def next_interval(self, idle, limit, is_idle, watching=False, sampling=False,
+                      next_boundary=None) -> float:
+        """
+        idle / limit:  current idle seconds and the idle threshold
+        is_idle:       whether the idle profile is currently applied
+        watching:      IdleMonitor watches report crossings for us
+        sampling:      a consumer needs periodic samples (temperature RGB)
+        next_boundary: idle seconds of the next deeper idle tier, if any
+        """
+        if sampling:
+            return self.min_interval
+
+        if watching:
+            if is_idle and next_boundary is not None:
+                # the watch only covers the first tier, wake up for the next one
+                return self._clamp(next_boundary - idle)
+            # transitions are event driven, ticks only refresh the tray
+            return self.max_interval
+
+        if is_idle:
+            return self.min_interval
+
+        return self._clamp(limit - idle)
+
+    def _clamp(self, seconds) -> float:
+        return float(min(max(seconds, self.min_interval), self.max_interval))
+
+    def record_wakeup(self):
+        self.wakeups += 1
+
+    @property
+    def wakeups_per_hour(self) -> float:
+        hours = (time.monotonic() - self.started) / 3600
+        if hours <= 0:
+            return 0.0
+        return self.wakeups / hours
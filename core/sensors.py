@@ -0,0 +1,265 @@
+import os
+import threading
+import time
+from array import array
+
+from core.event_log import event_log
+
+# thermal zone types and hwmon driver names that report the CPU package,
+# in order of preference
+CPU_THERMAL_ZONE_TYPES = ("x86_pkg_temp",)
+CPU_HWMON_NAMES = ("coretemp", "k10temp", "zenpower")
+
+
+def _read_text(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+# power_supply temperatures are in tenths of a degree
+_POWER_SUPPLY_SCALE = 100
+CPU_SENSOR = "cpu"
+
+
+def discover_sensor_inputs(sysfs_root="/sys") -> list[tuple[str, str, int]]:
+    """
+    All temperature inputs worth sampling, as (name, path, scale) where
+    value * scale is millidegrees. Names are stable across boots:
+    "thermal:x86_pkg_temp", "nvme:Composite", "coretemp:Core 0",
+    "power_supply:BAT0".
+    """
+    found = []
+    seen = set()
+
+    def add(name, path, scale=1):
+        # a second sensor with the same label gets a numbered name
+        unique, n = name, 2
+        while unique in seen:
+            unique, n = f"{name}#{n}", n + 1
+        seen.add(unique)
+        found.append((unique, path, scale))
+
+    thermal = os.path.join(sysfs_root, "class", "thermal")
+    try:
+        zones = sorted(os.listdir(thermal), key=lambda z: (len(z), z))
+    except OSError:
+        zones = []
+    for zone in zones:
+        path = os.path.join(thermal, zone, "temp")
+        kind = _read_text(os.path.join(thermal, zone, "type"))
+        if kind and os.path.exists(path):
+            add(f"thermal:{kind}", path)
+
+    hwmon = os.path.join(sysfs_root, "class", "hwmon")
+    try:
+        devices = sorted(os.listdir(hwmon), key=lambda d: (len(d), d))
+    except OSError:
+        devices = []
+    for dev in devices:
+        base = os.path.join(hwmon, dev)
+        driver = _read_text(os.path.join(base, "name")) or dev
+        try:
+            inputs = sorted(f for f in os.listdir(base) if f.startswith("temp") and f.endswith("_input"))
+        except OSError:
+            continue
+        for entry in inputs:
+            channel = entry.removesuffix("_input")
+            label = _read_text(os.path.join(base, f"{channel}_label")) or channel
+            add(f"{driver}:{label}", os.path.join(base, entry))
+
+    supplies = os.path.join(sysfs_root, "class", "power_supply")
+    try:
+        batteries = sorted(os.listdir(supplies))
+    except OSError:
+        batteries = []
+    for supply in batteries:
+        path = os.path.join(supplies, supply, "temp")
+        if os.path.exists(path):
+            add(f"power_supply:{supply}", path, _POWER_SUPPLY_SCALE)
+
+    return found
+
+
+class SensorArray:
+    """
+    Every temperature input, sampled in one pass.
+
+    Inputs are discovered and opened once; a sample is one os.pread per
+    descriptor into preallocated array('i') slots (millidegrees), with no
+    path lookups or per-sample allocations beyond the read itself. Each
+    slot also keeps an integer EWMA (alpha = 1 / 2**smoothing_shift) for
+    consumers that want steady values.
+
+    A failed read keeps the previous value. An input that fails
+    MAX_FAILURES reads in a row (e.g. a hwmon channel that always returns
+    ENODATA) is skipped until the next discovery. Only an input whose
+    file is gone (driver reload, NVMe hot-plug) triggers a rediscovery,
+    at most every REDISCOVER_MIN seconds, doubling up to REDISCOVER_MAX
+    while inputs keep disappearing. Inputs that survive a discovery keep
+    their smoothed values.
+
+    Sampling runs on the probe thread while discovery can be asked for
+    from the GUI (sensor list) or a reload, and reads come from the
+    write thread: all of them hold self.lock, so no one preads a closed
+    descriptor or sees the arrays swapped halfway.
+    """
+
+    MAX_FAILURES = 3
+    REDISCOVER_MIN = 10
+    REDISCOVER_MAX = 600
+
+    def __init__(self, sysfs_root="/sys", smoothing_shift=2, clock=time.monotonic):
+        self.sysfs_root = sysfs_root
+        self.smoothing_shift = smoothing_shift
+        self.clock = clock
+        self.names: list[str] = []
+        self.index: dict[str, int] = {}
+        self.cpu_index = None
+        self.raw = array("i")
+        self.smoothed = array("i")
+        self.primed = bytearray()
+        self.failures = bytearray()
+        self._fds: list[int] = []
+        self._paths: list[str] = []
+        self._scales: list[int] = []
+        self.discovered = False
+        self.rediscover_at = 0.0
+        self.rediscover_delay = self.REDISCOVER_MIN
+        self.lock = threading.RLock()
+
+    def discover(self) -> int:
+        with self.lock:
+            return self._discover()
+
+    def _discover(self) -> int:
+        # carried over to the inputs that are still there
+        previous = {
+            name: (self.raw[i], self.smoothed[i], self.primed[i])
+            for name, i in self.index.items()
+        }
+        self._close()
+        for name, path, scale in discover_sensor_inputs(self.sysfs_root):
+            try:
+                fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+            except OSError:
+                continue
+            self.index[name] = len(self.names)
+            self.names.append(name)
+            self._fds.append(fd)
+            self._paths.append(path)
+            self._scales.append(scale)
+
+        count = len(self.names)
+        self.raw = array("i", bytes(4 * count))
+        self.smoothed = array("i", bytes(4 * count))
+        self.primed = bytearray(count)
+        self.failures = bytearray(count)
+        for name, i in self.index.items():
+            if name in previous:
+                self.raw[i], self.smoothed[i], self.primed[i] = previous[name]
+        self.cpu_index = self._find_cpu()
+        self.discovered = True
+        event_log.debug("sensor", "Discovered %s temperature inputs", count)
+        return count
+
+    def rescan(self):
+        """Discover again on the next sample, without the backoff."""
+        with self.lock:
+            self.discovered = False
+            self.rediscover_delay = self.REDISCOVER_MIN
+
+    def _find_cpu(self) -> int | None:
+        for kind in CPU_THERMAL_ZONE_TYPES:
+            if f"thermal:{kind}" in self.index:
+                return self.index[f"thermal:{kind}"]
+        for driver in CPU_HWMON_NAMES:
+            for name, i in self.index.items():
+                if name.startswith(f"{driver}:"):
+                    return i
+        return None
+
+    def close(self):
+        with self.lock:
+            self._close()
+
+    def _close(self):
+        for fd in self._fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds = []
+        self._paths = []
+        self._scales = []
+        self.names = []
+        self.index = {}
+        self.cpu_index = None
+        self.discovered = False
+
+    def sample(self) -> int:
+        """Read every input once; returns how many reads succeeded."""
+        with self.lock:
+            return self._sample()
+
+    def _sample(self) -> int:
+        if not self.discovered:
+            self._discover()
+
+        raw, smoothed, primed, failures = self.raw, self.smoothed, self.primed, self.failures
+        shift = self.smoothing_shift
+        pread = os.pread
+        ok = 0
+        gone = False
+        for i, fd in enumerate(self._fds):
+            if failures[i] >= self.MAX_FAILURES:
+                continue
+            try:
+                value = int(pread(fd, 16, 0)) * self._scales[i]
+            except (OSError, ValueError):
+                failures[i] += 1
+                if failures[i] == self.MAX_FAILURES:
+                    event_log.warning("sensor", "Skipping %s after %s failed reads", self.names[i], self.MAX_FAILURES)
+                if not os.path.exists(self._paths[i]):
+                    gone = True
+                continue
+            failures[i] = 0
+            raw[i] = value
+            if primed[i]:
+                smoothed[i] += (value - smoothed[i]) >> shift
+            else:
+                smoothed[i] = value
+                primed[i] = 1
+            ok += 1
+
+        if gone:
+            # an input went away (driver reload, NVMe hot-plug)
+            now = self.clock()
+            if now >= self.rediscover_at:
+                self.discovered = False
+                self.rediscover_at = now + self.rediscover_delay
+                self.rediscover_delay = min(self.rediscover_delay * 2, self.REDISCOVER_MAX)
+        return ok
+
+    def lookup(self, name: str) -> int | None:
+        """Slot of a sensor name, "cpu" being the CPU package sensor."""
+        if name == CPU_SENSOR:
+            return self.cpu_index
+        return self.index.get(name)
+
+    def read(self, name=CPU_SENSOR, smoothed=True) -> int | None:
+        """Last sampled value in °C."""
+        with self.lock:
+            i = self.lookup(name)
+            if i is None or not self.primed[i]:
+                return None
+            return (self.smoothed[i] if smoothed else self.raw[i]) // 1000
+
+    def list_names(self) -> list[str]:
+        """Names of the inputs, discovering them first if needed."""
+        with self.lock:
+            if not self.discovered:
+                self._discover()
+            return list(self.names)
@@ -0,0 +1,36 @@
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class SystemSnapshot:
+    """
+    Everything a tick needs to know about the system, probed once.
+
+    The tray, the settings window, the keyboard logic and the log line
+    all read from the same snapshot, so they can never disagree within
+    a tick and no value is queried twice.
+    """
+
+    timestamp: float
+    idle_seconds: int
+    profile: str | None
+    cpu_temp: int | None
+    # smoothed temperature of the sensor the keyboard RGB follows
+    keyboard_temp: int | None
+    # percent busy and percent stalled on CPU (PSI) since the last
+    # sample, None unless the load stage is enabled
+    cpu_load: float | None
+    cpu_pressure: float | None
+    # profile of the first app rule with a running process, None when
+    # nothing matches or there are no app_rules
+    app_profile: str | None
+
+    # capability flags
+    idle_monitor_available: bool
+    power_profiles_available: bool
+    keyboard_available: bool
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.timestamp
@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+
+# set by the entry point when it should exit as soon as the tray is up
+EXIT_AFTER_STARTUP_ENV = "AUTO_IDLE_EXIT_AFTER_STARTUP"
+
+
+def parse_importtime(text: str) -> list[tuple[int, int, str]]:
+    """
+    Parse `python -X importtime` output into (self_us, cumulative_us, module).
+    """
+    rows = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            rows.append((int(fields[0]), int(fields[1]), fields[2].rstrip()))
+        except ValueError:
+            continue  # header line
+    return rows
+
+
+def summarise_importtime(text: str, top: int = 20) -> str:
+    rows = parse_importtime(text)
+    if not rows:
+        return "No import timings recorded."
+
+    total = sum(row[0] for row in rows)
+    lines = [f"{len(rows)} modules imported in {total / 1000:.1f} ms", ""]
+
+    # top-level packages: sum of self time of everything below them
+    packages = {}
+    for self_us, _, name in rows:
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    lines.append(f"{'package':<28}{'self ms':>10}{'share':>8}")
+    for package, us in sorted(packages.items(), key=lambda x: -x[1])[:top]:
+        lines.append(f"{package:<28}{us / 1000:>10.1f}{us / total:>8.0%}")
+
+    lines += ["", f"{'module (cumulative)':<40}{'ms':>10}"]
+    for _, cumulative, name in sorted(rows, key=lambda r: -r[1])[:top]:
+        lines.append(f"{name.strip()[:40]:<40}{cumulative / 1000:>10.1f}")
+    return "\n".join(lines)
+
+
+def profile_imports(script: str, top: int = 20) -> int:
+    """
+    Start the app once under -X importtime, let it exit right after the
+    tray icon is shown, and print a summary of where import time went.
+    """
+    env = dict(os.environ, **{EXIT_AFTER_STARTUP_ENV: "1"})
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", script],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    print(summarise_importtime(proc.stderr, top))
+    for line in proc.stdout.splitlines():
+        if line.startswith("tray_ready_ms="):
+            print("\n" + line)
+    return proc.returncode
@@ -0,0 +1,426 @@
+"""
+Qt-free system access: idle time, power profile, keyboard RGB and CPU
+temperature. Used directly by the headless daemon; the tray registers
+its QtDBus clients as backends (see gui.helpers) and falls back to the
+subprocess paths here when they are unavailable.
+"""
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.config import PROCFS_ROOT, SYSFS_ROOT, settings
+from core.color_lut import compile_temperature_lut, lookup_temperature_color
+from core.event_log import event_log
+from core.keyboard_queue import MANUAL, PROFILE, TEMPERATURE, KeyboardQueue
+from core.metrics import metrics
+from core.procscan import ProcessScanner
+from core.procstat import CpuLoadSampler
+from core.sensors import CPU_SENSOR, SensorArray
+from core.snapshot import SystemSnapshot
+from core.tiers import KEYBOARD_OFF
+
+current_profile = None
+# set while an idle tier has turned the keyboard backlight off
+keyboard_off = False
+
+# optional persistent clients registered by the GUI:
+#   idle_backend:    is_available(), get_idle_ms()
+#   profile_backend: is_available(), active_profile, set_active_profile()
+#   keyboard_backend: is_available(), set_color(), disable()
+idle_backend = None
+profile_backend = None
+keyboard_backend = None
+
+# cached result of is_asusctl_available()
+asusctl_available = None
+
+# every temperature input, sampled once per snapshot; "cpu" is the
+# package sensor among them
+sensors = SensorArray(SYSFS_ROOT)
+# /proc/stat and CPU pressure, sampled while settings.load is enabled
+cpu_load = CpuLoadSampler(PROCFS_ROOT)
+# running processes matched against settings.app_rules
+process_scanner = ProcessScanner(PROCFS_ROOT)
+
+# compiled temperature_rgb["points"], see rebuild_temperature_lut()
+temperature_lut = None
+
+# every keyboard write goes through here, see set_keyboard_color_for_mode()
+keyboard_queue = KeyboardQueue(lambda *args: write_keyboard(*args))
+
+# CLOCK_BOOTTIME - CLOCK_MONOTONIC, grows by the time spent suspended
+_suspend_offset = None
+SUSPEND_GAP_SECONDS = 5
+
+# last collected SystemSnapshot, for consumers outside the tick (tray click)
+last_snapshot = None
+
+# total external processes spawned, reported in the tick log
+subprocess_calls = 0
+
+_probe_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="probe")
+
+
+def _available(backend):
+    return backend is not None and backend.is_available()
+
+
+def is_asusctl_available():
+    # a PATH scan, done once rather than on every snapshot
+    global asusctl_available
+    if asusctl_available is None:
+        asusctl_available = shutil.which("asusctl") is not None
+    return asusctl_available
+
+
+def is_keyboard_available():
+    """Keyboard RGB can be written: through asusd, or with asusctl."""
+    return _available(keyboard_backend) or is_asusctl_available()
+
+
+def run_command(args):
+    global subprocess_calls
+    subprocess_calls += 1
+    stats = metrics.probe(f"exec_{args[0]}")
+    start = time.perf_counter_ns()
+    try:
+        return subprocess.run(args, check=True)
+    except Exception:
+        stats.errors += 1
+        raise
+    finally:
+        stats.record(time.perf_counter_ns() - start)
+
+
+def read_command(args):
+    global subprocess_calls
+    subprocess_calls += 1
+    stats = metrics.probe(f"exec_{args[0]}")
+    start = time.perf_counter_ns()
+    try:
+        return subprocess.check_output(args, text=True)
+    except Exception:
+        stats.errors += 1
+        raise
+    finally:
+        stats.record(time.perf_counter_ns() - start)
+
+
+@metrics.timed("write_keyboard")
+def write_keyboard(color, brightness):
+    """
+    Set keyboard color (#rrggbb) and brightness through asusd, falling
+    back to asusctl when the daemon interface is unavailable.
+    """
+    backend = keyboard_backend
+    if _available(backend):
+        try:
+            backend.set_color(color, brightness)
+            return
+        except Exception as e:
+            metrics.record_error("write_keyboard")
+            event_log.warning("keyboard", "asusd write failed, falling back to asusctl: %s", e)
+            backend.disable()
+
+    # set color
+    run_command(["asusctl", "aura", "static", "-c", color.replace("#", "")])
+
+    # set brightness
+    run_command(["asusctl", "-k", brightness])
+
+
+def get_status_message(profile: str | None = None):
+    profile = profile or get_current_profile() or "unknown"
+
+    return f"Mode: {profile}"
+
+
+@metrics.timed("get_current_profile")
+def get_current_profile():
+    backend = profile_backend
+    if _available(backend):
+        return backend.active_profile
+
+    try:
+        out = read_command(["powerprofilesctl", "get"]).strip()
+        return out
+    except Exception as e:
+        metrics.record_error("get_current_profile")
+        event_log.error("profile", "Failed to get current profile: %s", e)
+        return None
+
+
+@metrics.timed("get_idle_seconds")
+def get_idle_seconds():
+    backend = idle_backend
+    if _available(backend):
+        try:
+            return backend.get_idle_ms() // 1000
+        except Exception as e:
+            metrics.record_error("get_idle_seconds")
+            event_log.warning("idle", "IdleMonitor D-Bus call failed, falling back to gdbus: %s", e)
+
+    return get_idle_seconds_gdbus()
+
+
+def get_idle_seconds_gdbus():
+    try:
+        out = read_command(
+            [
+                "gdbus", "call",
+                "--session",
+                "--dest", "org.gnome.Mutter.IdleMonitor",
+                "--object-path", "/org/gnome/Mutter/IdleMonitor/Core",
+                "--method", "org.gnome.Mutter.IdleMonitor.GetIdletime"
+            ]
+        ).strip()
+        # expected format like "(uint64 12345,)"
+        parts = out.split()
+        if len(parts) >= 2:
+            ms = int(parts[1].strip(",)"))
+            return ms // 1000
+    except Exception as e:
+        metrics.record_error("get_idle_seconds")
+        event_log.error("idle", "get_idle_seconds failed: %s", e)
+    return 0
+
+
+@metrics.timed("set_profile")
+def set_profile(profile, idle):
+    global current_profile
+    if current_profile == profile:
+        return
+
+    try:
+        backend = profile_backend
+        if _available(backend):
+            backend.set_active_profile(profile)
+        else:
+            run_command(["powerprofilesctl", "set", profile])
+    except Exception as e:
+        metrics.record_error("set_profile")
+        event_log.error("profile", "Failed to set profile: %s", e)
+        return
+
+    current_profile = profile
+
+    event_log.info("transition", "Switched to %s (idle %ss)", profile, idle)
+
+    set_keyboard_color_for_mode(profile)
+    event_log.debug("keyboard", "Keyboard color set for mode: %s", profile)
+
+
+def apply_idle_tier(tier, idle):
+    """Profile and keyboard state of an idle tier, see core.tiers."""
+    global keyboard_off
+    keyboard_off = tier.get("keyboard") == KEYBOARD_OFF
+    set_profile(tier["profile"], idle)
+    if keyboard_off:
+        set_keyboard_off(tier["profile"])
+    else:
+        apply_temperature_keyboard_rgb(profile=tier["profile"])
+
+
+def apply_active(profile, idle):
+    global keyboard_off
+    keyboard_off = False
+    set_profile(profile, idle)
+    apply_temperature_keyboard_rgb(profile=profile)
+
+
+def set_keyboard_off(mode, source=PROFILE):
+    if not is_keyboard_available():
+        return
+    # with temperature RGB on, keyboard["enabled"] is off but the
+    # backlight is still ours to turn off
+    if not (settings.keyboard.get("enabled", True) or settings.temperature_rgb.get("enabled")):
+        return
+
+    color = settings.keyboard["modes"].get(mode, {}).get("color", "#000000")
+    keyboard_queue.request(source, color, "off")
+
+
+def set_keyboard_color_for_mode(mode, source=PROFILE):
+    if keyboard_off:
+        return
+    if not is_keyboard_available():
+        return
+    if not settings.keyboard.get("enabled", True):
+        return
+
+    kbd_cfg = settings.keyboard["modes"].get(mode)
+    if not kbd_cfg:
+        return
+
+    color = kbd_cfg.get("color", "").lower()
+    brightness = kbd_cfg.get("brightness", "med")
+
+    # basic validation: 7 hex chars
+    if len(color) != 7 or not all(c in "#0123456789abcdef" for c in color):
+        event_log.warning("keyboard", "Invalid HEX color for %s: %s", mode, color)
+        return
+
+    # identical requests (every tick) are dropped by the queue
+    keyboard_queue.request(source, color, brightness)
+
+
+def get_keyboard_color_by_cpu_temp(temp_c: int | None = None) -> str | None:
+    """
+    Returns HEX color (with #) based on current CPU temperature,
+    or None if temperature RGB is disabled.
+    Pass temp_c to reuse an already sampled temperature.
+    """
+    if not settings.temperature_rgb.get("enabled"):
+        return None
+
+    if temp_c is None:
+        try:
+            temp_c = sensors.read(settings.temperature_rgb.get("sensor", CPU_SENSOR))
+            if temp_c is None:
+                temp_c = read_cpu_temperature()
+            # print("Current CPU temperature:", temp_c)
+        except Exception as e:
+            event_log.error("sensor", "Failed to read CPU temperature: %s", e)
+            return None
+        if temp_c is None:
+            return None
+
+    if temperature_lut is None:
+        rebuild_temperature_lut()
+
+    return lookup_temperature_color(temperature_lut, temp_c)
+
+
+def rebuild_temperature_lut():
+    """
+    Recompile the temperature color curve. Call after the points change
+    (settings applied or config reloaded); lookups only compile it once.
+    """
+    global temperature_lut
+    temperature_lut = compile_temperature_lut(
+        settings.temperature_rgb["points"],
+        gradient=settings.temperature_rgb.get("gradient", False),
+    )
+
+
+def apply_temperature_keyboard_rgb(snapshot: SystemSnapshot | None = None, source=TEMPERATURE, profile=None):
+    """
+    Keyboard RGB from the CPU temperature, or the profile's color when
+    temperature RGB is off. A transition passes the profile it just
+    applied: the tick's snapshot still has the one from before.
+    """
+    if keyboard_off:
+        return
+
+    profile = profile or (snapshot.profile if snapshot else get_current_profile())
+
+    if not settings.temperature_rgb.get("enabled"):
+        # restore power-mode keyboard RGB
+        set_keyboard_color_for_mode(profile, source if source == MANUAL else PROFILE)
+        return
+
+    if not (snapshot.keyboard_available if snapshot else is_keyboard_available()):
+        return
+
+    color = get_keyboard_color_by_cpu_temp(snapshot.keyboard_temp if snapshot else None)
+    if not color:
+        return
+
+    brightness = settings.temperature_rgb.get("brightness", "med")
+    keyboard_queue.request(source, color, brightness)
+
+
+def rescan_sensors():
+    """Find temperature inputs again, e.g. after a driver was loaded."""
+    sensors.rescan()
+
+
+def read_cpu_temperature() -> int | None:
+    """CPU package temperature from a fresh sample of every input."""
+    return sample_sensors()[0]
+
+
+def list_temperature_sensors() -> list[str]:
+    """Names temperature_rgb["sensor"] accepts."""
+    return [CPU_SENSOR] + sensors.list_names()
+
+
+@metrics.timed("sample_sensors")
+def sample_sensors() -> tuple[int | None, int | None]:
+    """
+    Sample every temperature input in one pass. Returns the raw CPU
+    package temperature and the smoothed temperature of the sensor the
+    keyboard follows (temperature_rgb["sensor"], "cpu" by default).
+    """
+    sensors.sample()
+    return (
+        sensors.read(CPU_SENSOR, smoothed=False),
+        sensors.read(settings.temperature_rgb.get("sensor", CPU_SENSOR)),
+    )
+
+
+def check_resumed() -> bool:
+    """True on the first call after the system was suspended."""
+    global _suspend_offset
+    offset = time.clock_gettime(time.CLOCK_BOOTTIME) - time.monotonic()
+    resumed = _suspend_offset is not None and offset - _suspend_offset > SUSPEND_GAP_SECONDS
+    _suspend_offset = offset
+    return resumed
+
+
+def collect_snapshot() -> SystemSnapshot:
+    """
+    Probe the system once for this tick. Idle time and temperature are
+    read in parallel; the profile comes from the D-Bus cache when the
+    daemon is reachable, otherwise from one powerprofilesctl call.
+    """
+    global last_snapshot
+
+    if check_resumed():
+        # the firmware may have reset the backlight while suspended
+        event_log.info("keyboard", "Resumed from suspend, keyboard state will be written again")
+        keyboard_queue.invalidate()
+
+    idle_future = _probe_pool.submit(get_idle_seconds)
+    temp_future = _probe_pool.submit(sample_sensors)
+    profile_future = _probe_pool.submit(get_current_profile)
+
+    # two preads, cheaper inline than through the pool
+    load = pressure = None
+    if settings.load.get("enabled"):
+        load = cpu_load.sample()
+        pressure = cpu_load.pressure
+    elif cpu_load.opened:
+        cpu_load.close()
+
+    app_profile = None
+    rules = settings.app_rules
+    if rules:
+        # a reload replaces the list, only this thread touches the scanner
+        if rules is not process_scanner.source:
+            process_scanner.configure(rules)
+        app_profile = process_scanner.scan()
+    elif process_scanner.processes:
+        process_scanner.clear()
+
+    try:
+        temp, keyboard_temp = temp_future.result()
+    except Exception as e:
+        event_log.error("sensor", "Failed to read temperatures: %s", e)
+        temp = keyboard_temp = None
+
+    last_snapshot = SystemSnapshot(
+        timestamp=time.monotonic(),
+        idle_seconds=idle_future.result(),
+        profile=profile_future.result(),
+        cpu_temp=temp,
+        keyboard_temp=keyboard_temp,
+        cpu_load=load,
+        cpu_pressure=pressure,
+        app_profile=app_profile,
+        idle_monitor_available=_available(idle_backend),
+        power_profiles_available=_available(profile_backend),
+        keyboard_available=is_keyboard_available(),
+    )
+    return last_snapshot
@@ -0,0 +1,138 @@
+import time
+from collections import deque
+
+# lowest to highest power
+PROFILE_ORDER = ("power-saver", "balanced", "performance")
+
+
+class ThermalGovernor:
+    """
+    Caps the power profile while the CPU runs hot.
+
+    The package temperature is smoothed with an EWMA and a least-squares
+    slope is fitted over the last `window` smoothed samples. When the
+    temperature predicted horizon_seconds ahead reaches limit_c, the cap
+    steps one profile below what would otherwise apply; once the smoothed
+    temperature is headroom_c below the limit and no longer rising, it
+    steps back up. Caps change at most once per dwell_seconds, except
+    that a step up is undone as soon as it overshoots. Such a step up
+    doubles the wait before the next one (up to MAX_BACKOFF times
+    dwell_seconds), so a load only the lower profile can sustain settles
+    there instead of cycling.
+
+    Priority: the idle policy picks a profile, the cap only ever lowers
+    it (clamp()). A pause or forced profile from `auto-idle ctl`
+    suspends both.
+    """
+
+    MAX_BACKOFF = 16
+
+    def __init__(self, limit_c=85, headroom_c=10, horizon_seconds=30, dwell_seconds=30,
+                 alpha=0.3, window=6, clock=time.monotonic):
+        self.limit_c = limit_c
+        self.headroom_c = headroom_c
+        self.horizon_seconds = horizon_seconds
+        self.dwell_seconds = dwell_seconds
+        self.alpha = alpha
+        self.clock = clock
+
+        self.samples = deque(maxlen=window)  # (time, smoothed temperature)
+        self.smoothed = None
+        self.slope = 0.0  # °C per second
+        self.cap = None  # index into PROFILE_ORDER, None when not capped
+        self.changed_at = None
+        self.stepped_up = False
+        self.up_delay = dwell_seconds
+        self.steps = 0
+
+    def configure(self, limit_c, headroom_c, horizon_seconds, dwell_seconds):
+        self.limit_c = limit_c
+        self.headroom_c = headroom_c
+        self.horizon_seconds = horizon_seconds
+        self.dwell_seconds = dwell_seconds
+        self.up_delay = dwell_seconds
+
+    def reset(self):
+        self.samples.clear()
+        self.smoothed = None
+        self.slope = 0.0
+        self.cap = None
+        self.changed_at = None
+        self.stepped_up = False
+        self.up_delay = self.dwell_seconds
+
+    @property
+    def predicted(self) -> float | None:
+        if self.smoothed is None:
+            return None
+        return self.smoothed + max(self.slope, 0.0) * self.horizon_seconds
+
+    @property
+    def capped_profile(self) -> str | None:
+        return PROFILE_ORDER[self.cap] if self.cap is not None else None
+
+    def clamp(self, profile: str) -> str:
+        if self.cap is None or profile not in PROFILE_ORDER:
+            return profile
+        return PROFILE_ORDER[min(PROFILE_ORDER.index(profile), self.cap)]
+
+    def _fit_slope(self):
+        n = len(self.samples)
+        if n < 2:
+            return 0.0
+        t0 = self.samples[0][0]
+        mean_t = sum(t - t0 for t, _ in self.samples) / n
+        mean_v = sum(v for _, v in self.samples) / n
+        var = sum((t - t0 - mean_t) ** 2 for t, _ in self.samples)
+        if var == 0:
+            return 0.0
+        cov = sum((t - t0 - mean_t) * (v - mean_v) for t, v in self.samples)
+        return cov / var
+
+    def update(self, temp_c, profile: str) -> bool:
+        """
+        Feed one sample; profile is what the idle policy wants right now.
+        Returns True when the cap changed and the profile must be re-applied.
+        """
+        if temp_c is None or profile not in PROFILE_ORDER:
+            return False
+
+        now = self.clock()
+        if self.smoothed is None:
+            self.smoothed = float(temp_c)
+        else:
+            self.smoothed += self.alpha * (temp_c - self.smoothed)
+        self.samples.append((now, self.smoothed))
+        self.slope = self._fit_slope()
+
+        since = now - self.changed_at if self.changed_at is not None else None
+        # a step up that overshoots is undone right away; other changes
+        # wait for the previous one to take effect
+        settled = since is None or since >= self.dwell_seconds
+
+        wanted = PROFILE_ORDER.index(profile)
+        level = wanted if self.cap is None else min(wanted, self.cap)
+
+        if self.predicted >= self.limit_c and level > 0 and (settled or self.stepped_up):
+            if self.stepped_up and since < 2 * self.up_delay:
+                # the last step up did not hold
+                self.up_delay = min(self.up_delay * 2, self.dwell_seconds * self.MAX_BACKOFF)
+            self.cap = level - 1
+            self.stepped_up = False
+        elif (
+            self.cap is not None
+            and settled
+            and (since is None or since >= self.up_delay)
+            and self.smoothed <= self.limit_c - self.headroom_c
+            and self.slope <= 0
+        ):
+            if since is not None and since > 4 * self.up_delay:
+                self.up_delay = max(self.up_delay / 2, self.dwell_seconds)
+            self.cap = self.cap + 1 if self.cap + 1 < wanted else None
+            self.stepped_up = True
+        else:
+            return False
+
+        self.changed_at = now
+        self.steps += 1
+        return True
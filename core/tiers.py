@@ -0,0 +1,95 @@
+from bisect import bisect_right
+
+from core.event_log import event_log
+from core.thermal import PROFILE_ORDER
+
+KEYBOARD_ON = "on"
+KEYBOARD_OFF = "off"
+
+# Settings fields tiers_from_settings() reads
+TIER_FIELDS = {"idle_minutes", "idle_mode", "idle_tiers"}
+
+
+def _valid_tier(tier) -> bool:
+    if not isinstance(tier, dict):
+        return False
+    minutes = tier.get("minutes")
+    return (
+        not isinstance(minutes, bool)
+        and isinstance(minutes, (int, float))
+        and tier.get("profile") in PROFILE_ORDER
+        and tier.get("keyboard", KEYBOARD_ON) in (KEYBOARD_ON, KEYBOARD_OFF)
+    )
+
+
+def tiers_from_settings(settings) -> list[dict]:
+    """
+    The first tier is idle_minutes/idle_mode, settings.idle_tiers add
+    deeper ones: {"minutes": 60, "profile": "power-saver", "keyboard": "off"}.
+    Tiers at or below idle_minutes are ignored, malformed ones are
+    skipped: the tray builds its pipeline before the settings are
+    validated (see Settings.check_idle_tier).
+    """
+    base = {"minutes": settings.idle_minutes, "profile": settings.idle_mode, "keyboard": KEYBOARD_ON}
+    deeper = []
+    for tier in settings.idle_tiers:
+        if not _valid_tier(tier):
+            event_log.warning("tiers", "Ignoring idle tier %r", tier)
+        elif tier["minutes"] > settings.idle_minutes:
+            deeper.append(tier)
+    return [base] + sorted(deeper, key=lambda t: t["minutes"])
+
+
+class IdleTiers:
+    """
+    How deep into idle the user is.
+
+    IdlePolicy still decides active vs idle against the first tier
+    (limit); while idle this only moves forward through the tiers, so an
+    update compares idle time with the next boundary instead of scanning
+    the list, and the scheduler can sleep exactly until that boundary.
+    """
+
+    def __init__(self, tiers=()):
+        self.tiers = []
+        self.boundaries = []
+        self.index = -1
+        self.configure(tiers)
+
+    def configure(self, tiers):
+        """Replace the tiers; the current tier is found again on the next update."""
+        self.tiers = list(tiers)
+        self.boundaries = [t["minutes"] * 60 for t in self.tiers]
+        self.index = -1
+
+    @property
+    def limit(self) -> int:
+        """Idle seconds of the first tier, the active -> idle threshold."""
+        return self.boundaries[0]
+
+    @property
+    def current(self) -> dict | None:
+        return self.tiers[self.index] if self.index >= 0 else None
+
+    @property
+    def next_boundary(self) -> int | None:
+        nxt = self.index + 1
+        return self.boundaries[nxt] if nxt < len(self.boundaries) else None
+
+    def update(self, idle, is_idle) -> dict | None:
+        """Returns the tier just entered, if any. Call after IdlePolicy.update()."""
+        if not is_idle:
+            self.index = -1
+            return None
+
+        if self.index < 0:
+            # entering idle, or tiers reconfigured while idle: skip straight
+            # to the tier matching the current idle time
+            self.index = max(bisect_right(self.boundaries, idle) - 1, 0)
+            return self.tiers[self.index]
+
+        nxt = self.index + 1
+        if nxt < len(self.boundaries) and idle >= self.boundaries[nxt]:
+            self.index = max(bisect_right(self.boundaries, idle) - 1, nxt)
+            return self.tiers[self.index]
+        return None
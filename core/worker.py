@@ -0,0 +1,96 @@
+import traceback
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from core.event_log import event_log
+
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class Task(QRunnable):
+    """Run fn(*args) on a pool thread and report back through signals."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        # created on the submitting (GUI) thread, so connected slots are
+        # invoked there through a queued connection
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception:
+            self.signals.failed.emit(traceback.format_exc())
+        else:
+            self.signals.finished.emit(result)
+
+
+class SystemWorker(QObject):
+    """
+    Keeps system I/O off the Qt GUI thread.
+
+    Probes (one tick's snapshot) run on their own pool and at most one
+    is in flight: a tick requested while the previous one is still
+    running is skipped. Writes (profile, keyboard) go to a single thread
+    so they are applied in the order they were submitted.
+    """
+
+    snapshot_ready = pyqtSignal(object)
+    snapshot_failed = pyqtSignal(str)
+
+    def __init__(self, collect, parent=None):
+        super().__init__(parent)
+        self.collect = collect
+        self.busy = False
+        self.skipped_ticks = 0
+
+        self._probe_pool = QThreadPool(self)
+        self._probe_pool.setMaxThreadCount(1)
+        self._write_pool = QThreadPool(self)
+        self._write_pool.setMaxThreadCount(1)
+        # QRunnables are not referenced by Qt from Python, keep them alive
+        self._tasks = set()
+
+    def _start(self, pool, task):
+        self._tasks.add(task)
+        task.setAutoDelete(False)
+        task.signals.finished.connect(lambda _, t=task: self._tasks.discard(t))
+        task.signals.failed.connect(lambda _, t=task: self._tasks.discard(t))
+        pool.start(task)
+
+    def request_snapshot(self) -> bool:
+        if self.busy:
+            self.skipped_ticks += 1
+            return False
+
+        self.busy = True
+        task = Task(self.collect)
+        task.signals.finished.connect(self._on_snapshot)
+        task.signals.failed.connect(self._on_snapshot_failed)
+        self._start(self._probe_pool, task)
+        return True
+
+    def submit(self, fn, *args):
+        task = Task(fn, *args)
+        task.signals.failed.connect(
+            lambda tb: event_log.error("worker", "Background write failed: %s", tb)
+        )
+        self._start(self._write_pool, task)
+
+    def wait(self, msecs=-1):
+        self._probe_pool.waitForDone(msecs)
+        self._write_pool.waitForDone(msecs)
+
+    def _on_snapshot(self, snapshot):
+        self.busy = False
+        self.snapshot_ready.emit(snapshot)
+
+    def _on_snapshot_failed(self, tb):
+        self.busy = False
+        event_log.error("worker", "Snapshot collection failed: %s", tb)
+        self.snapshot_failed.emit(tb)
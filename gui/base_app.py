@@ -1,17 +1,26 @@
 # ---- UI ----
+from PyQt6.QtCore import QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QVBoxLayout, QTabWidget, QWidget, QLabel
+from PyQt6.QtWidgets import QApplication, QVBoxLayout, QTabWidget, QWidget, QLabel
 
 from config.config import settings
 from config.config_service import save_settings
-from gui.helpers import icon_path_for_mode, get_current_profile, icon_for_mode, enable_autostart, disable_autostart, \
-    set_keyboard_color_for_mode, set_profile, apply_temperature_keyboard_rgb
+from core.event_log import event_log
+from core.tiers import KEYBOARD_OFF, KEYBOARD_ON
+from gui.helpers import icon_path_for_mode, icon_for_mode, enable_autostart, disable_autostart, \
+    rebuild_temperature_lut
 from gui.tabs import ui_create_tab_settings, ui_create_tab_keyboard, ui_create_tab_temperature, ui_create_tab_about
 
 APP_ICON = icon_path_for_mode(settings.active_mode)
 
+# applies within this window are written to config.json once
+SAVE_DELAY_MS = 500
+
 
 class MainWindowAppGUI(QWidget):
+    # emitted after apply() stored new settings
+    settings_applied = pyqtSignal()
+
     def __init__(self):
         super().__init__()
 
@@ -19,6 +28,14 @@ class MainWindowAppGUI(QWidget):
         self.setMinimumSize(350, 400)
         self.setWindowIcon(QIcon(APP_ICON))
 
+        # see schedule_save()
+        self.save_pending = False
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(SAVE_DELAY_MS)
+        self.save_timer.timeout.connect(self.flush_save)
+        QApplication.instance().aboutToQuit.connect(self.flush_save)
+
         main_layout = QVBoxLayout(self)
         tabs = QTabWidget()
         main_layout.addWidget(tabs)
@@ -47,16 +64,38 @@ class MainWindowAppGUI(QWidget):
         self.idle_mode.currentIndexChanged.connect(self.update_keyboard_preview)
 
         self.temp_enable_cb.stateChanged.connect(self.mark_dirty)
+        self.temp_gradient_cb.stateChanged.connect(self.mark_dirty)
 
         self.kbd_enable_cb.toggled.connect(self.on_keyboard_rgb_toggled)
         self.temp_enable_cb.toggled.connect(self.on_temperature_rgb_toggled)
 
         self.update_keyboard_preview()
-        self.refresh_current_mode_from_system()
+
+    def closeEvent(self, event):
+        self.flush_save()
+        super().closeEvent(event)
 
     # --------------------------------------------------
     # Helpers
     # --------------------------------------------------
+    def schedule_save(self):
+        """
+        Debounced save: settings are live in memory right away, the file
+        is written once SAVE_DELAY_MS after the last apply.
+        """
+        self.save_pending = True
+        self.save_timer.start()
+
+    def flush_save(self):
+        if not self.save_pending:
+            return
+        self.save_pending = False
+        self.save_timer.stop()
+        try:
+            save_settings(settings)
+        except OSError as e:
+            event_log.error("settings", "Failed to save settings: %s", e)
+
     def set_swatch_color(self, swatch: QLabel, hex_str: str):
         hex_str = (hex_str or "").strip().lower()
 
@@ -106,20 +145,12 @@ class MainWindowAppGUI(QWidget):
             f"• When idle: {mapping.get(self.idle_mode.currentText())}"
         )
 
-    def refresh_current_mode_from_system(self):
-        profile = get_current_profile()
-        if not profile:
-            return
-
-        # update label
+    def refresh_current_mode_from_system(self, profile):
+        # only the label: the live profile may be thermal-capped, load
+        # boosted or set by an app rule, and the "When active" selector
+        # would save that as settings.active_mode on the next apply
         self.update_current_mode(profile)
 
-        # sync UI selectors with real system state
-        if profile in ("balanced", "performance"):
-            self.active_mode.blockSignals(True)
-            self.active_mode.setCurrentText(profile)
-            self.active_mode.blockSignals(False)
-
     def on_keyboard_rgb_toggled(self, checked: bool):
         if checked:
             # turn off temperature RGB
@@ -148,6 +179,14 @@ class MainWindowAppGUI(QWidget):
         settings.idle_minutes = self.idle_spin.value()
         settings.active_mode = self.active_mode.currentText()
         settings.idle_mode = self.idle_mode.currentText()
+        settings.idle_tiers = [
+            {
+                "minutes": fields["minutes"].value(),
+                "profile": fields["profile"].currentText(),
+                "keyboard": KEYBOARD_OFF if fields["keyboard_off"].isChecked() else KEYBOARD_ON,
+            }
+            for fields in self.tier_rows
+        ]
 
         settings.keyboard["enabled"] = self.kbd_enable_cb.isChecked()
         for mode, fields in self.kbd_fields.items():
@@ -155,24 +194,23 @@ class MainWindowAppGUI(QWidget):
             settings.keyboard["modes"][mode]["brightness"] = fields["brightness"].currentText()
 
         settings.temperature_rgb["enabled"] = self.temp_enable_cb.isChecked()
+        settings.temperature_rgb["gradient"] = self.temp_gradient_cb.isChecked()
+        settings.temperature_rgb["sensor"] = self.temp_sensor.currentText()
         for temp, field in self.temp_fields.items():
             settings.temperature_rgb["points"][temp] = field.text().lower()
+        rebuild_temperature_lut()
 
-        save_settings(settings)
+        self.schedule_save()
 
         if self.autostart_cb.isChecked():
             enable_autostart()
         else:
             disable_autostart()
 
-        # apply keyboard immediately
-        set_keyboard_color_for_mode(settings.active_mode)
-        apply_temperature_keyboard_rgb()
-
-        # apply power profile only if active/idle modes changed
-        set_profile(settings.active_mode, idle=0)
-
         self.apply_btn.setEnabled(False)
         if hasattr(self, "kbd_apply_btn"):
             self.kbd_apply_btn.setEnabled(False)
-        print("Settings saved:", settings)
+        event_log.info("settings", "Settings saved: %s", settings)
+
+        # the app applies keyboard and profile changes off the GUI thread
+        self.settings_applied.emit()
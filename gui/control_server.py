@@ -0,0 +1,57 @@
+from PyQt6.QtCore import QObject
+from PyQt6.QtNetwork import QLocalServer
+
+from config.config import CONTROL_SOCKET
+from core.control import ControlError, decode_frame, dispatch, encode_frame, prepare_socket_path, split_frames
+from core.event_log import event_log
+
+
+class ControlServer(QObject):
+    """
+    The core.control socket served from the Qt event loop, for when the
+    tray runs without the daemon. Requests are handled on the GUI thread
+    against the owner's cached state.
+    """
+
+    def __init__(self, owner, path=CONTROL_SOCKET, parent=None):
+        super().__init__(parent)
+        self.owner = owner
+        self.path = path
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self.on_new_connection)
+
+    def listen(self) -> bool:
+        if not prepare_socket_path(self.path):
+            event_log.warning("control", "Control socket %s is in use", self.path)
+            return False
+        if not self.server.listen(self.path):
+            event_log.warning("control", "Failed to listen on %s: %s", self.path, self.server.errorString())
+            return False
+        return True
+
+    def close(self):
+        # also removes the socket file
+        self.server.close()
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            conn = self.server.nextPendingConnection()
+            buffer = bytearray()
+            conn.readyRead.connect(lambda conn=conn, buffer=buffer: self.on_ready_read(conn, buffer))
+            conn.disconnected.connect(conn.deleteLater)
+
+    def on_ready_read(self, conn, buffer):
+        buffer += bytes(conn.readAll())
+        try:
+            frames = split_frames(buffer)
+        except ControlError:
+            conn.abort()
+            return
+
+        for payload in frames:
+            try:
+                response = dispatch(self.owner, decode_frame(payload))
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            conn.write(encode_frame(response))
@@ -1,24 +1,69 @@
 import os
-import shutil
-import subprocess
-import time
 
+from PyQt6.QtDBus import QDBusConnection
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QSystemTrayIcon, QMessageBox
 
-from config.config import AUTOSTART_FILE, BASE_DIR, AUTOSTART_DIR, APP_EXEC, settings
-
-last_kbd_mode = None
-current_profile = None
-last_temp_color = None
+from config.config import AUTOSTART_FILE, BASE_DIR, AUTOSTART_DIR, APP_EXEC, USE_DBUS
+import core.system as system
+from core.asusd import AsusdKeyboard
+from core.event_log import event_log
+from core.idle_monitor import IdleMonitor
+from core.power_profiles import PowerProfiles
+from core.snapshot import SystemSnapshot
+# the Qt-free system helpers, re-exported for the GUI modules
+from core.system import (
+    is_asusctl_available, is_keyboard_available, run_command, read_command, write_keyboard,
+    get_status_message, get_current_profile, get_idle_seconds, get_idle_seconds_gdbus,
+    set_profile, apply_active, apply_idle_tier, set_keyboard_color_for_mode, get_keyboard_color_by_cpu_temp,
+    rebuild_temperature_lut, apply_temperature_keyboard_rgb, read_cpu_temperature,
+    list_temperature_sensors, collect_snapshot,
+)
+
+# persistent D-Bus clients, created on first use (need a Q*Application)
+# and registered as backends of core.system
+idle_monitor = None
+power_profiles = None
+asusd_keyboard = None
+
+# pre-rasterised icons per mode, see icon_for_mode()
+TRAY_ICON_SIZES = (16, 22, 24, 32, 48, 64)
+icon_cache = {}
 
 
 def is_autostart_enabled():
     return os.path.exists(AUTOSTART_FILE)
 
 
-def is_asusctl_available():
-    return shutil.which("asusctl") is not None
+def dbus_override():
+    """None to use the real buses, or a never-connected one if D-Bus is disabled."""
+    if USE_DBUS:
+        return None
+    return QDBusConnection("auto-idle-disabled")
+
+
+def get_asusd_keyboard():
+    global asusd_keyboard
+    if asusd_keyboard is None:
+        asusd_keyboard = AsusdKeyboard(dbus_override())
+        system.keyboard_backend = asusd_keyboard
+    return asusd_keyboard
+
+
+def get_power_profiles():
+    global power_profiles
+    if power_profiles is None:
+        power_profiles = PowerProfiles(dbus_override())
+        system.profile_backend = power_profiles
+    return power_profiles
+
+
+def get_idle_monitor():
+    global idle_monitor
+    if idle_monitor is None:
+        idle_monitor = IdleMonitor(dbus_override())
+        system.idle_backend = idle_monitor
+    return idle_monitor
 
 
 def icon_path_for_mode(mode):
@@ -35,10 +80,22 @@ def icon_path_for_mode(mode):
 
 
 def icon_for_mode(mode):
+    """
+    Cached per mode. The SVG is rasterised once for the usual tray sizes,
+    so handing the icon to the tray never re-renders it.
+    """
+    icon = icon_cache.get(mode)
+    if icon is not None:
+        return icon
+
     path = icon_path_for_mode(mode)
+    icon = QIcon()
     if path and os.path.exists(path):
-        return QIcon(path)
-    return QIcon()
+        svg = QIcon(path)
+        for size in TRAY_ICON_SIZES:
+            icon.addPixmap(svg.pixmap(size))
+    icon_cache[mode] = icon
+    return icon
 
 
 def enable_autostart():
@@ -59,7 +116,7 @@ def enable_autostart():
     #     "Autostart enabled",
     #     "Auto Idle Power Switcher will start automatically on login."
     # )
-    print("Autostart enabled")
+    event_log.info("autostart", "Autostart enabled")
 
 
 def disable_autostart():
@@ -70,7 +127,7 @@ def disable_autostart():
         #     "Autostart disabled",
         #     "Auto Idle Power Switcher will not start automatically on login."
         # )
-        print("Autostart disabled")
+        event_log.info("autostart", "Autostart disabled")
 
 
 def format_tooltip(profile, idle_seconds):
@@ -82,9 +139,9 @@ def format_tooltip(profile, idle_seconds):
     )
 
 
-def show_status_message(tray):
-    profile = get_current_profile() or "unknown"
-    mins = settings.last_idle_seconds // 60
+def show_status_message(tray, snapshot: SystemSnapshot):
+    profile = snapshot.profile or "unknown"
+    mins = snapshot.idle_seconds // 60
 
     tray.showMessage(
         "Auto Idle Power Switcher",
@@ -92,196 +149,3 @@ def show_status_message(tray):
         QSystemTrayIcon.Information,
         3000
     )
-
-
-def get_status_message():
-    profile = get_current_profile() or "unknown"
-
-    return f"Mode: {profile}"
-
-
-def get_current_profile():
-    try:
-        out = subprocess.check_output(
-            ["powerprofilesctl", "get"],
-            text=True
-        ).strip()
-        return out
-    except Exception as e:
-        print("Failed to get current profile:", e)
-        return None
-
-
-# ---- System helpers ----
-def get_idle_seconds():
-    try:
-        out = subprocess.check_output(
-            [
-                "gdbus", "call",
-                "--session",
-                "--dest", "org.gnome.Mutter.IdleMonitor",
-                "--object-path", "/org/gnome/Mutter/IdleMonitor/Core",
-                "--method", "org.gnome.Mutter.IdleMonitor.GetIdletime"
-            ],
-            text=True
-        ).strip()
-        # expected format like "(uint64 12345,)"
-        parts = out.split()
-        if len(parts) >= 2:
-            ms = int(parts[1].strip(",)"))
-            return ms // 1000
-    except Exception as e:
-        print("get_idle_seconds failed:", e)
-    return 0
-
-
-def set_profile(profile, idle):
-    global current_profile
-    if current_profile == profile:
-        return
-
-    try:
-        subprocess.run(
-            ["powerprofilesctl", "set", profile],
-            check=True
-        )
-    except subprocess.CalledProcessError as e:
-        print("Failed to set profile:", e)
-        return
-
-    current_profile = profile
-
-    icon = icon_for_mode(profile)
-
-    ts = time.strftime("%H:%M:%S")
-    print(f"[{ts}] Switched to {profile} (idle {idle}s)")
-
-    set_keyboard_color_for_mode(profile)
-    print("Keyboard color set for mode:", profile)
-
-
-def set_keyboard_color_for_mode(mode):
-    global last_kbd_mode
-
-    if not is_asusctl_available():
-        return
-    if not settings.keyboard.get("enabled", True):
-        return
-    if last_kbd_mode == mode:
-        return  # ← STOP reapplying every 5 seconds
-
-    kbd_cfg = settings.keyboard["modes"].get(mode)
-    if not kbd_cfg:
-        return
-
-    color = kbd_cfg.get("color", "").lower()
-    brightness = kbd_cfg.get("brightness", "med")
-
-    # basic validation: 7 hex chars
-    if len(color) != 7 or not all(c in "#0123456789abcdef" for c in color):
-        print(f"Invalid HEX color for {mode}: {color}")
-        return
-
-    try:
-        # set color
-        subprocess.run(
-            ["asusctl", "aura", "static", "-c", color.replace("#", "")],
-            check=True
-        )
-
-        # set brightness
-        subprocess.run(
-            ["asusctl", "-k", brightness],
-            check=True
-        )
-
-        print(
-            f"Keyboard set for {mode}: "
-            f"{color.upper()}, brightness={brightness}"
-        )
-
-    except Exception as e:
-        print("Failed to set keyboard RGB:", e)
-
-
-def get_keyboard_color_by_cpu_temp() -> str | None:
-    """
-    Returns HEX color (with #) based on current CPU temperature,
-    or None if temperature RGB is disabled.
-    """
-    if not settings.temperature_rgb.get("enabled"):
-        return None
-
-    try:
-        temp_c = read_cpu_temperature()
-        # print("Current CPU temperature:", temp_c)
-    except Exception as e:
-        print("Failed to read CPU temperature:", e)
-        return None
-
-    points = settings.temperature_rgb["points"]
-
-    # keys are strings like "30", "40", ...
-    thresholds = sorted(int(t) for t in points.keys())
-
-    selected = thresholds[0]
-
-    for t in thresholds:
-        if temp_c >= t:
-            selected = t
-        else:
-            break
-
-    return points[str(selected)]
-
-
-def apply_temperature_keyboard_rgb():
-    global last_temp_color
-
-    if not settings.temperature_rgb.get("enabled"):
-        last_temp_color = None
-        # restore power-mode keyboard RGB
-        set_keyboard_color_for_mode(get_current_profile())
-        return
-
-    color = get_keyboard_color_by_cpu_temp()
-    if not color:
-        return
-
-    if color == last_temp_color:
-        return
-    brightness = settings.temperature_rgb.get("brightness", "med")
-
-    try:
-        subprocess.run(
-            ["asusctl", "aura", "static", "-c", color.replace("#", "")],
-            check=True
-        )
-        # set brightness
-        subprocess.run(
-            ["asusctl", "-k", brightness],
-            check=True
-        )
-        # print("asusctl", "aura", "static", "-c", color.replace("#", ""))
-        print(f"Temperature keyboard RGB applied: {color.upper()}, brightness={brightness}")
-        last_temp_color = color
-    except Exception as e:
-        print("Failed to apply temperature RGB:", e)
-
-
-def read_cpu_temperature() -> int | None:
-    base = "/sys/class/thermal"
-
-    for zone in os.listdir(base):
-        type_path = os.path.join(base, zone, "type")
-        temp_path = os.path.join(base, zone, "temp")
-
-        try:
-            with open(type_path) as f:
-                if f.read().strip() == "x86_pkg_temp":
-                    with open(temp_path) as tf:
-                        return int(tf.read().strip()) // 1000
-        except OSError:
-            continue
-
-    return None
@@ -2,16 +2,14 @@ from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel,
     QSpinBox, QComboBox, QPushButton,
-    QCheckBox, QHBoxLayout, QLineEdit, QMenu, QSystemTrayIcon
+    QCheckBox, QHBoxLayout, QLineEdit
 )
 
 from PyQt6.QtCore import Qt
 
 from config.config import settings
-from gui.helpers import (
-    is_autostart_enabled, is_asusctl_available,
-    get_status_message, show_status_message
-)
+from core.tiers import KEYBOARD_OFF
+from gui.helpers import is_autostart_enabled, is_keyboard_available, list_temperature_sensors
 
 
 def ui_show_info_not_found_asusctl(self, current_layout):
@@ -84,6 +82,19 @@ def ui_create_tab_settings(self, tabs):
 
     settings_layout.addLayout(profiles_layout)
 
+    settings_layout.addSpacing(6)
+    settings_layout.addWidget(QLabel("Deeper idle tiers:"))
+
+    self.tier_rows = []
+    self.tiers_layout = QVBoxLayout()
+    for tier in settings.idle_tiers:
+        ui_add_idle_tier_row(self, tier)
+    settings_layout.addLayout(self.tiers_layout)
+
+    add_tier_btn = QPushButton("Add tier")
+    add_tier_btn.clicked.connect(lambda: (ui_add_idle_tier_row(self), self.mark_dirty()))
+    settings_layout.addWidget(add_tier_btn, alignment=Qt.AlignmentFlag.AlignLeft)
+
     self.kbd_preview = QLabel()
     self.kbd_preview.setStyleSheet("color: gray;")
     settings_layout.addWidget(self.kbd_preview)
@@ -98,7 +109,7 @@ def ui_create_tab_keyboard(self, tabs):
     kbd_tab = QWidget()
     kbd_layout = QVBoxLayout(kbd_tab)
 
-    if not is_asusctl_available():
+    if not is_keyboard_available():
         ui_show_info_not_found_asusctl(self, kbd_layout)
 
     else:
@@ -149,6 +160,20 @@ def ui_create_tab_temperature(self, tabs):
 
     temp_layout.addWidget(self.temp_enable_cb)
 
+    self.temp_gradient_cb = QCheckBox("Smooth gradient between points")
+    self.temp_gradient_cb.setChecked(settings.temperature_rgb.get("gradient", False))
+    temp_layout.addWidget(self.temp_gradient_cb)
+
+    sensor_row = QHBoxLayout()
+    sensor_row.addWidget(QLabel("Sensor:"))
+    self.temp_sensor = QComboBox()
+    self.temp_sensor.addItems(list_temperature_sensors())
+    self.temp_sensor.setCurrentText(settings.temperature_rgb.get("sensor", "cpu"))
+    self.temp_sensor.currentTextChanged.connect(self.mark_dirty)
+    sensor_row.addWidget(self.temp_sensor)
+    sensor_row.addStretch()
+    temp_layout.addLayout(sensor_row)
+
     temp_layout.addSpacing(8)
     temp_layout.addWidget(QLabel("Color scale (HEX):"))
 
@@ -235,6 +260,52 @@ def ui_add_kbd_row(self, kbd_layout, label, key):
     kbd_layout.addLayout(row)
 
 
+def ui_add_idle_tier_row(self, tier=None):
+    tier = tier or {"minutes": settings.idle_minutes + 30, "profile": "power-saver", "keyboard": KEYBOARD_OFF}
+
+    row_widget = QWidget()
+    row = QHBoxLayout(row_widget)
+    row.setContentsMargins(0, 0, 0, 0)
+
+    row.addWidget(QLabel("After"))
+    minutes = QSpinBox()
+    minutes.setRange(2, 480)
+    minutes.setValue(tier["minutes"])
+    row.addWidget(minutes)
+    row.addWidget(QLabel("min:"))
+
+    profile = QComboBox()
+    profile.addItems(["power-saver", "balanced"])
+    profile.setCurrentText(tier["profile"])
+    row.addWidget(profile)
+
+    keyboard_off = QCheckBox("Keyboard off")
+    keyboard_off.setChecked(tier.get("keyboard") == KEYBOARD_OFF)
+    row.addWidget(keyboard_off)
+
+    fields = {
+        "minutes": minutes,
+        "profile": profile,
+        "keyboard_off": keyboard_off,
+    }
+
+    def remove():
+        self.tier_rows.remove(fields)
+        row_widget.deleteLater()
+        self.mark_dirty()
+
+    remove_btn = QPushButton("Remove")
+    remove_btn.clicked.connect(remove)
+    row.addWidget(remove_btn)
+
+    minutes.valueChanged.connect(self.mark_dirty)
+    profile.currentTextChanged.connect(self.mark_dirty)
+    keyboard_off.stateChanged.connect(self.mark_dirty)
+
+    self.tier_rows.append(fields)
+    self.tiers_layout.addWidget(row_widget)
+
+
 def ui_add_temp_row(self, layout, temp, key):
     row = QHBoxLayout()
     text_label = QLabel(f"{temp}°C")
@@ -277,17 +348,3 @@ def ui_add_kbd_buttons_apply_close(self, current_layout, attr_name):
     btn_layout.addWidget(btn)
     btn_layout.addWidget(close_btn)
     current_layout.addLayout(btn_layout)
-
-
-def ui_setup_tray_menu(window_settings, tray, app):
-    menu = QMenu()
-    menu.addAction(get_status_message(), window_settings.show)
-    menu.addSeparator()
-    menu.addAction("Settings", window_settings.show)
-    menu.addAction("Quit", app.quit)
-
-    tray.setContextMenu(menu)
-    tray.activated.connect(
-        lambda reason: show_status_message(tray)
-        if reason == QSystemTrayIcon.Trigger else None
-    )
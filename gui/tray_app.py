@@ -0,0 +1,355 @@
+from PyQt6.QtCore import QObject, QSocketNotifier, Qt, QTimer
+from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import QSystemTrayIcon
+
+from config.config import settings
+from config.config_service import reload_changed, validate_settings
+from core.control import status_fields
+from core.daemon import daemon_running
+from core.event_log import event_log
+from core.owner import PipelineOwner
+from core.pipeline import ProfilePipeline
+from core.scheduler import AdaptiveScheduler
+from core.worker import SystemWorker
+import core.system as system
+from gui.helpers import (
+    icon_for_mode, icon_path_for_mode, get_idle_monitor, get_power_profiles,
+    get_asusd_keyboard, set_profile,
+    get_status_message, show_status_message, collect_snapshot,
+    get_keyboard_color_by_cpu_temp, apply_temperature_keyboard_rgb, rebuild_temperature_lut
+)
+from gui.tray_menu import ui_setup_tray_menu
+
+
+class TrayApp(QObject, PipelineOwner):
+    """
+    The tray icon, the settings window and the tick loop that drives
+    the idle policy. Created once by app-auto-idle-power.py.
+
+    When the headless daemon is running the tray is only a client: it
+    shows the state but leaves profile and keyboard writes to the daemon.
+    """
+
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+        self.daemon_pid = daemon_running()
+
+        # ---- Shared state ----
+        # idle policy, tiers, thermal cap and ctl overrides
+        self.pipeline = ProfilePipeline()
+        self.last_idle_seconds = 0
+        # serves `auto-idle ctl`, started once startup finished
+        self.control_server = None
+        # reloads config.json edited on disk, set up once startup finished
+        self.config_watcher = None
+        self.config_timer = None
+        self.config_notifier = None
+
+        # ---- UI ----
+        # the settings window is built on first open, see show_settings()
+        self.window_settings = None
+        self.last_profile = None
+        # a tray click before the first snapshot, shown once it arrives
+        self.status_requested = False
+
+        app_icon = icon_path_for_mode(settings.active_mode)
+        self.tray = QSystemTrayIcon(QIcon(app_icon) if app_icon else icon_for_mode(settings.active_mode))
+        self.tray.setToolTip("Auto Idle Power Switcher")
+        # what the tray currently shows, see update_tray()
+        self.tray_profile = None
+        self.tray_tooltip = None
+        ui_setup_tray_menu(self, self.tray, app)
+
+        # D-Bus clients must be created on the GUI thread, before any worker runs
+        get_idle_monitor()
+        get_power_profiles()
+        get_asusd_keyboard()
+        self.worker = SystemWorker(collect_snapshot, self)
+        self.scheduler = AdaptiveScheduler()
+
+        # single-shot, re-armed by schedule_next_tick(); the very coarse
+        # timer lets the kernel coalesce our wakeups with others
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self.timer.timeout.connect(self.tick)
+
+        get_idle_monitor().idle_changed.connect(self.on_idle_changed)
+        get_power_profiles().profile_changed.connect(self.on_profile_changed)
+        self.worker.snapshot_ready.connect(self.on_snapshot)
+        self.worker.snapshot_failed.connect(
+            lambda _: self.timer.start(self.scheduler.min_interval * 1000)
+        )
+
+    # --------------------------------------------------
+    # Settings window
+    # --------------------------------------------------
+    def show_settings(self):
+        if self.window_settings is None:
+            # imported here: most sessions never open the window
+            from gui.base_app import MainWindowAppGUI
+
+            window = MainWindowAppGUI()
+            window.settings_applied.connect(self.on_settings_applied)
+            if settings.release_window_on_close:
+                # free the widgets again once the user is done
+                window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+                window.destroyed.connect(self.on_settings_destroyed)
+            self.window_settings = window
+
+        if self.last_profile:
+            self.window_settings.refresh_current_mode_from_system(self.last_profile)
+        else:
+            # filled in by on_snapshot()
+            self.timer.start(0)
+
+        self.window_settings.show()
+        self.window_settings.raise_()
+        self.window_settings.activateWindow()
+
+    def show_status(self):
+        """Tray click: the last snapshot, or the next one if there is none yet."""
+        if system.last_snapshot is not None:
+            show_status_message(self.tray, system.last_snapshot)
+            return
+        self.status_requested = True
+        self.timer.start(0)
+
+    def on_settings_destroyed(self):
+        self.window_settings = None
+
+    @property
+    def client_mode(self) -> bool:
+        return self.daemon_pid is not None
+
+    def settings_visible(self) -> bool:
+        return self.window_settings is not None and self.window_settings.isVisible()
+
+    def start(self):
+        self.tray.show()
+        if self.client_mode:
+            event_log.info("startup", "Daemon running (pid %s), tray is display only", self.daemon_pid)
+        self.arm_idle_watch()
+        self.timer.start(0)
+
+    def finish_startup(self):
+        """
+        Deferred work that is not needed to show the tray icon: the full
+        settings validation skipped at load time, the config watcher and
+        the control socket.
+        """
+        validate_settings()
+        rebuild_temperature_lut()
+        self.pipeline.configure()
+        self.arm_idle_watch()
+        self.watch_config()
+
+        # with a daemon running, `auto-idle ctl` talks to the daemon
+        if not self.client_mode:
+            from gui.control_server import ControlServer
+
+            self.control_server = ControlServer(self, parent=self)
+            if self.control_server.listen():
+                self.app.aboutToQuit.connect(self.control_server.close)
+
+    # --------------------------------------------------
+    # Idle transitions
+    # --------------------------------------------------
+    def evaluate_idle(self, idle, snapshot=None):
+        policy = self.pipeline.policy
+        action = self.pipeline.evaluate(idle, snapshot)
+        if action is not None:
+            self.submit(*action)
+
+        # user-active watches are one-shot; keep one armed while idle
+        monitor = get_idle_monitor()
+        if monitor.is_watching() and policy.is_idle and not policy.settling:
+            monitor.watch_user_active()
+
+        return action
+
+    def on_idle_changed(self, idle_now):
+        # the watch fired exactly on the crossing, no need to ask Mutter again
+        idle = settings.idle_minutes * 60 if idle_now else 0
+        self.evaluate_idle(idle)
+        event_log.debug(
+            "idle", "IdleMonitor watch fired: idle=%ss state=%s settling=%s",
+            idle, self.pipeline.policy.state, self.pipeline.policy.settling
+        )
+        # a pending return to active needs follow-up samples
+        self.schedule_next_tick(idle)
+
+    def arm_idle_watch(self):
+        """
+        Register Mutter idle watches for the current threshold.
+        Re-armed whenever settings.idle_minutes changes; if watches are
+        unavailable tick() keeps polling instead.
+        """
+        if self.client_mode:
+            return
+
+        monitor = get_idle_monitor()
+        limit_ms = settings.idle_minutes * 60 * 1000
+        if monitor.is_watching() and monitor.watch_ms == limit_ms:
+            return
+
+        if not monitor.watch(limit_ms):
+            event_log.warning("idle", "IdleMonitor watches unavailable, polling idle time")
+            return
+
+        # watches only fire on crossings, so sync with the current state
+        # once; the idle time comes from a snapshot on the worker
+        self.timer.start(0)
+
+    def on_profile_changed(self, profile):
+        # manual changes (GNOME Settings, powerprofilesctl) arrive here right away
+        self.last_profile = profile
+        self.update_tray(profile)
+        if self.settings_visible():
+            self.window_settings.refresh_current_mode_from_system(profile)
+
+    def update_tray(self, profile):
+        """
+        Only touch the tray when something changed: every setIcon and
+        setToolTip is a StatusNotifier update over D-Bus.
+        """
+        if profile != self.tray_profile:
+            self.tray.setIcon(icon_for_mode(profile))
+            self.tray_profile = profile
+
+        tooltip = get_status_message(profile)
+        if tooltip != self.tray_tooltip:
+            self.tray.setToolTip(tooltip)
+            self.tray_tooltip = tooltip
+
+    def apply_settings_to_system(self):
+        """
+        Apply the saved settings right away, through the pipeline so the
+        thermal cap, app rules and load offset still hold. While paused
+        from `auto-idle ctl` they stay pending until the pause ends.
+        """
+        pipeline = self.pipeline
+        pipeline.pending = True
+        if pipeline.control.paused:
+            return
+        pipeline.pending = False
+        self.submit(*pipeline.action(self.last_idle_seconds))
+
+    def on_settings_applied(self):
+        if self.client_mode:
+            # the daemon's config watcher picks up the saved file
+            return
+
+        self.pipeline.configure()
+        self.arm_idle_watch()
+        self.apply_settings_to_system()
+        # the threshold may have moved closer, re-plan the next wakeup now
+        self.timer.start(0)
+
+    # --------------------------------------------------
+    # Control socket
+    # --------------------------------------------------
+    def control_status(self) -> dict:
+        return status_fields("tray", system.last_snapshot, self.pipeline, self.scheduler, system.keyboard_queue)
+
+    def submit(self, fn, *args):
+        self.worker.submit(fn, *args)
+
+    def force_profile(self, profile):
+        self.submit(set_profile, profile, 0)
+
+    def replan(self):
+        self.timer.start(0)
+
+    def reload_config(self):
+        # an explicit reload also looks for sensors that appeared since
+        system.rescan_sensors()
+        self.apply_config_changes(reload_changed())
+
+    # --------------------------------------------------
+    # Config reload
+    # --------------------------------------------------
+    def watch_config(self):
+        # imported here, like the settings window: not needed for the tray icon
+        from config.config_watcher import ConfigWatcher
+
+        self.config_watcher = ConfigWatcher()
+        self.config_timer = QTimer(self)
+        self.config_timer.timeout.connect(self.check_config)
+
+        fd = self.config_watcher.fileno()
+        if fd is not None:
+            # inotify events restart a short single-shot timer
+            self.config_timer.setSingleShot(True)
+            self.config_timer.setInterval(ConfigWatcher.DEBOUNCE_MS)
+            self.config_notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+            self.config_notifier.activated.connect(self.on_config_event)
+        else:
+            self.config_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+            self.config_timer.start(ConfigWatcher.POLL_INTERVAL * 1000)
+
+    def on_config_event(self):
+        if self.config_watcher.read_events():
+            self.config_timer.start()
+
+    def check_config(self):
+        if self.config_watcher.changed():
+            self.reload_config()
+
+    def apply_config_changes(self, changed):
+        super().apply_config_changes(changed)
+        if "idle_minutes" in changed:
+            self.arm_idle_watch()
+
+    # --------------------------------------------------
+    # Background timer
+    # --------------------------------------------------
+    def tick(self):
+        self.scheduler.record_wakeup()
+        # probes run on the worker; an overlapping tick is skipped
+        self.worker.request_snapshot()
+
+    def schedule_next_tick(self, idle):
+        interval = self.pipeline.next_interval(
+            self.scheduler,
+            idle,
+            watching=self.client_mode or get_idle_monitor().is_watching(),
+        )
+        self.timer.start(int(interval * 1000))
+        return interval
+
+    def tick_details(self, snapshot) -> dict:
+        return {
+            "color": get_keyboard_color_by_cpu_temp(snapshot.keyboard_temp),
+            "skipped_ticks": self.worker.skipped_ticks,
+        }
+
+    def on_snapshot(self, snapshot):
+        idle = snapshot.idle_seconds
+        self.last_idle_seconds = idle
+
+        # with watches this only confirms pending transitions, without it
+        # is the polling fallback
+        action = None
+        if not self.client_mode:
+            action = self.evaluate_idle(idle, snapshot)
+
+        # keep UI in sync with real system state; a hidden window is
+        # refreshed when it is shown again
+        if snapshot.profile:
+            self.last_profile = snapshot.profile
+            if self.settings_visible():
+                self.window_settings.refresh_current_mode_from_system(snapshot.profile)
+            self.update_tray(snapshot.profile)
+
+        # a transition writes the keyboard for the profile it applied,
+        # the snapshot still has the previous one
+        if not self.client_mode and action is None:
+            self.submit(apply_temperature_keyboard_rgb, snapshot)
+        if self.status_requested:
+            self.status_requested = False
+            show_status_message(self.tray, snapshot)
+        interval = self.schedule_next_tick(idle)
+        self.export_metrics()
+        self.log_tick(snapshot, interval)
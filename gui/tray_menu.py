@@ -0,0 +1,49 @@
+from PyQt6.QtWidgets import QMenu, QPlainTextEdit, QSystemTrayIcon
+
+from core.event_log import event_log
+from core.metrics import metrics
+from gui.helpers import get_status_message
+
+
+def ui_show_text_window(self, attr_name, title, text):
+    # kept on the owner so the window is not garbage collected
+    view = getattr(self, attr_name, None)
+    if view is None:
+        view = QPlainTextEdit()
+        view.setReadOnly(True)
+        view.setWindowTitle(title)
+        view.resize(640, 400)
+        setattr(self, attr_name, view)
+
+    view.setPlainText(text)
+    view.verticalScrollBar().setValue(view.verticalScrollBar().maximum())
+    view.show()
+    view.raise_()
+
+
+def ui_show_recent_events(self):
+    ui_show_text_window(
+        self, "events_view", "Auto Idle - Recent events",
+        "\n".join(record.format() for record in event_log.recent(200))
+        or "No events recorded yet."
+    )
+
+
+def ui_show_metrics(self):
+    ui_show_text_window(self, "metrics_view", "Auto Idle - Metrics", metrics.to_json())
+
+
+def ui_setup_tray_menu(owner, tray, app):
+    menu = QMenu()
+    menu.addAction(get_status_message(), owner.show_settings)
+    menu.addSeparator()
+    menu.addAction("Settings", owner.show_settings)
+    menu.addAction("Recent events", lambda: ui_show_recent_events(owner))
+    menu.addAction("Metrics", lambda: ui_show_metrics(owner))
+    menu.addAction("Quit", app.quit)
+
+    tray.setContextMenu(menu)
+    tray.activated.connect(
+        lambda reason: owner.show_status()
+        if reason == QSystemTrayIcon.Trigger else None
+    )
@@ -42,7 +42,6 @@ cp "$OLD_DEB/DEBIAN/postinst" "$NEW_DEB/DEBIAN/postinst"
 cp "$OLD_DEB/DEBIAN/prerm"    "$NEW_DEB/DEBIAN/prerm"
 
 # runtime files
-cp "$OLD_DEB/usr/bin/auto-idle" "$NEW_DEB/usr/bin/auto-idle"
 cp -r "$OLD_DEB/usr/share/auto-idle" "$NEW_DEB/usr/share/"
 cp -r "$OLD_DEB/usr/share/applications" "$NEW_DEB/usr/share/"
 cp -r "$OLD_DEB/usr/share/icons" "$NEW_DEB/usr/share/"
@@ -51,16 +50,20 @@ cp -r "$OLD_DEB/usr/share/icons" "$NEW_DEB/usr/share/"
 cp -r app-auto-idle-power.py "$NEW_DEB/usr/share/auto-idle/"
 cp -r config "$NEW_DEB/usr/share/auto-idle/"
 cp -r gui "$NEW_DEB/usr/share/auto-idle/"
+cp -r core "$NEW_DEB/usr/share/auto-idle/"
 
 # ---- update control version ---------------------------------------
 
 sed -i "s/^Version: .*/Version: ${NEW_VERSION}/" \
   "$NEW_DEB/DEBIAN/control"
 
-# ---- fix launcher --------------------------------------------------
+# ---- launcher ------------------------------------------------------
 
-sed -i 's|^exec python3|exec /usr/bin/python3|' \
-  "$NEW_DEB/usr/bin/auto-idle"
+# passes its arguments on: --daemon, ctl ..., --profile-imports
+cat > "$NEW_DEB/usr/bin/auto-idle" <<'LAUNCHER'
+#!/bin/sh
+exec /usr/bin/python3 /usr/share/auto-idle/app-auto-idle-power.py "$@"
+LAUNCHER
 
 # ---- permissions (important) --------------------------------------
 